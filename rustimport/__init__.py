@@ -34,14 +34,24 @@ For more information check the Readme on GitHub: https://github.com/mityax/rusti
 import logging as _logging
 from shutil import which
 from types import ModuleType
-
-from rustimport import settings
-from rustimport.error_handling import BuildError
+from typing import Optional
 
 _logger = _logging.getLogger("rustimport")
 
 
-def imp(fullname, opt_in: bool = False, force_rebuild: bool = settings.force_rebuild) -> ModuleType:
+def __getattr__(name):
+    # Lazily resolve the attributes below (PEP 562) so that merely importing
+    # rustimport doesn't pay for their modules:
+    if name == 'settings':
+        import rustimport.settings
+        return rustimport.settings
+    if name == 'BuildError':
+        from rustimport.error_handling import BuildError
+        return BuildError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def imp(fullname, opt_in: bool = False, force_rebuild: Optional[bool] = None) -> ModuleType:
     """
     Explicit alternative to using rustimport.import_hook.
 
@@ -53,6 +63,7 @@ def imp(fullname, opt_in: bool = False, force_rebuild: bool = settings.force_reb
 
     @return: The compiled and loaded Python extension module.
     """
+    from rustimport import settings
     from rustimport.load import dlopen_flags
 
     if settings.release_mode:
@@ -71,7 +82,7 @@ def imp(fullname, opt_in: bool = False, force_rebuild: bool = settings.force_reb
     return importable.load()
 
 
-def imp_from_path(path, fullname=None, opt_in: bool = False, force_rebuild: bool = settings.force_rebuild) -> ModuleType:
+def imp_from_path(path, fullname=None, opt_in: bool = False, force_rebuild: Optional[bool] = None) -> ModuleType:
     """
     Imports a Rust module from a specified file path.
 
@@ -84,6 +95,7 @@ def imp_from_path(path, fullname=None, opt_in: bool = False, force_rebuild: bool
 
     @return: The compiled and loaded Python extension module.
     """
+    from rustimport import settings
     from rustimport.load import dlopen_flags
 
     if settings.release_mode:
@@ -91,18 +103,17 @@ def imp_from_path(path, fullname=None, opt_in: bool = False, force_rebuild: bool
         with dlopen_flags():
             return importlib.import_module(fullname)
 
-    from rustimport.importable import all_importables
+    from rustimport.importable import importable_for_path
     from rustimport.importable import should_rebuild
 
-    for importable in all_importables:
-        if i := importable.try_create(path, fullname=fullname, opt_in=opt_in):
-            if should_rebuild(i, force_rebuild=force_rebuild):
-                i.build(release=settings.compile_release_binaries)
-            return i.load()
+    if i := importable_for_path(path, fullname=fullname, opt_in=opt_in):
+        if should_rebuild(i, force_rebuild=force_rebuild):
+            i.build(release=settings.compile_release_binaries)
+        return i.load()
 
 
-def build(fullname, opt_in: bool = False, force_rebuild: bool = settings.force_rebuild,
-          release: bool = settings.compile_release_binaries):
+def build(fullname, opt_in: bool = False, force_rebuild: Optional[bool] = None,
+          release: Optional[bool] = None):
     """
     Builds a rust extension without importing it.
 
@@ -115,9 +126,13 @@ def build(fullname, opt_in: bool = False, force_rebuild: bool = settings.force_r
 
     @return: An [Importable] instance for the given extension.
     """
+    from rustimport import settings
     from rustimport.find import find_module_importable
     from rustimport.importable import should_rebuild
 
+    if release is None:
+        release = settings.compile_release_binaries
+
     importable = find_module_importable(fullname, opt_in=opt_in)
     if should_rebuild(importable, force_rebuild=force_rebuild, force_release=release):
         importable.build(release=release)
@@ -125,8 +140,8 @@ def build(fullname, opt_in: bool = False, force_rebuild: bool = settings.force_r
     return importable
 
 
-def build_filepath(path, opt_in: bool = False, force_rebuild: bool = settings.force_rebuild,
-                   release: bool = settings.compile_release_binaries):
+def build_filepath(path, opt_in: bool = False, force_rebuild: Optional[bool] = None,
+                   release: Optional[bool] = None):
     """
     Builds a rust extension module from a specified file path, without importing it.
 
@@ -140,18 +155,21 @@ def build_filepath(path, opt_in: bool = False, force_rebuild: bool = settings.fo
     @return: An [Importable] instance for the given extension.
     """
 
-    from rustimport.importable import all_importables
+    from rustimport import settings
+    from rustimport.importable import importable_for_path
     from rustimport.importable import should_rebuild
 
-    for importable in all_importables:
-        if i := importable.try_create(path, opt_in=opt_in):
-            if should_rebuild(i, force_rebuild=force_rebuild, force_release=release):
-                i.build(release=release)
-                return importable
+    if release is None:
+        release = settings.compile_release_binaries
+
+    if i := importable_for_path(path, opt_in=opt_in):
+        if should_rebuild(i, force_rebuild=force_rebuild, force_release=release):
+            i.build(release=release)
+        return i
 
 
-def build_all(root_directory, opt_in: bool = True, force_rebuild: bool = settings.force_rebuild,
-              release: bool = settings.compile_release_binaries):
+def build_all(root_directory, opt_in: bool = True, force_rebuild: Optional[bool] = None,
+              release: Optional[bool] = None, workers: Optional[int] = None):
     """
     Builds all eligible rust extensions modules in the specified directory.
 
@@ -161,43 +179,118 @@ def build_all(root_directory, opt_in: bool = True, force_rebuild: bool = setting
     @param force_rebuild: Whether to force re-compilation of the extension, even if it hasn't changed. Default is
                           derived from settings.
     @param release: Whether to build a release binary. Default is derived from settings.
+    @param workers: The number of extensions to build in parallel. Since cargo runs as a separate
+                    process, this scales up to the host's cpu count. Default is derived from settings.
 
     @return: A tuple of two lists of [Importable]s, one with the built [Importable]s and one with those
              skipped: `(built, not_built)`
     """
     import os
+    from rustimport import settings
     from rustimport.importable import (
         SingleFileImportable,
         CrateImportable,
         should_rebuild,
     )
 
+    if release is None:
+        release = settings.compile_release_binaries
+    if workers is None:
+        workers = settings.build_workers
+
     importables = []
 
     _logger.info(f"Collecting rust extensions in {root_directory}…")
 
-    for directory, subdirs, files in os.walk(root_directory, topdown=True):
-        if any(f.lower() == 'cargo.toml' for f in files):
+    # We traverse the tree manually using `os.scandir` instead of `os.walk`/`os.fwalk` as
+    # the former stats every entry a second time, which is noticeably slower on large source
+    # trees, and the latter is not available on all platforms and would hand us directory
+    # file descriptors that are of no use to the path-based `Importable` API.
+    ignore_patterns = _load_rustimportignore(root_directory)
+
+    stack = [root_directory]
+    while stack:
+        directory = stack.pop()
+
+        # Classify all entries in a single pass over the directory:
+        is_crate = False
+        rs_files = []
+        subdirs = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.lower() == 'cargo.toml' or entry.name == '.rustimport':
+                    # A crate root (the ".rustimport" marker is dropped next to the
+                    # manifest by `rustimport new`); the remaining entries don't
+                    # matter, so stop reading the directory right away:
+                    is_crate = True
+                    break
+                elif ignore_patterns and _is_ignored(entry.path, root_directory, ignore_patterns):
+                    continue
+                elif entry.name.endswith('.rs') and entry.is_file(follow_symlinks=False):
+                    rs_files.append(entry.path)
+                elif entry.is_dir(follow_symlinks=False) and entry.name not in _default_ignored_dirs:
+                    subdirs.append(entry.path)
+
+        if is_crate:
             if i := CrateImportable.try_create(directory, opt_in=opt_in):
                 importables.append(i)
-            # We never recurse into subdirectories of crates:
-            del subdirs[:]
-        else:
-            for file in files:
-                if os.path.splitext(file)[1] == '.rs':
-                    i = SingleFileImportable.try_create(os.path.join(directory, file), opt_in=opt_in)
-                    if i is not None:
-                        importables.append(i)
+            continue  # we never recurse into subdirectories of crates
+
+        for file in rs_files:
+            if i := SingleFileImportable.try_create(file, opt_in=opt_in):
+                importables.append(i)
+        stack.extend(subdirs)
 
     _logger.info(f"Found {len(importables)} {'extension' if len(importables) == 1 else 'extensions'}.")
 
+    to_build = []
     not_built = []
-    for index, i in enumerate(importables):
-        if should_rebuild(i, force_rebuild=force_rebuild, force_release=release):
-            _logger.info(f"Building {i.path} ({index + 1}/{len(importables)})…")
+
+    # Memoize stats during this pass — importables often share dependency files
+    # (e.g. a workspace's Cargo.toml), which would otherwise be statted repeatedly:
+    from rustimport.checksum import cached_stats
+    with cached_stats():
+        for i in importables:
+            if should_rebuild(i, force_rebuild=force_rebuild, force_release=release):
+                to_build.append(i)
+            else:
+                not_built.append(i)
+
+    # Group importables sharing a build directory — i.e. crates in the same cargo
+    # workspace — so each group is built back-to-back and reuses the group's freshly
+    # warmed target directory (dependencies are compiled only once per workspace).
+    # Cargo locks the target directory anyway, so parallelizing within a group would
+    # only serialize on that lock.
+    build_groups: dict = {}
+    for i in to_build:
+        build_groups.setdefault(i.build_tempdir, []).append(i)
+
+    if workers > 1 and len(build_groups) > 1:
+        # Cargo runs as a separate process, so building with a thread pool scales
+        # up to the host's cpu count:
+        from concurrent.futures import ThreadPoolExecutor
+        from rustimport.error_handling import BuildError
+
+        def build_group(group):
+            for i in group:
+                i.build(release=release)
+
+        _logger.info(f"Building {len(to_build)} extensions using {min(workers, len(build_groups))} workers…")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(build_group, group) for group in build_groups.values()]
+            # Let all groups finish before failing, then aggregate the errors —
+            # aborting on the first failed crate would discard the others' progress:
+            errors = [e for f in futures if (e := f.exception()) is not None]
+
+        if errors:
+            raise BuildError(
+                f"Failed to build {len(errors)} {'extension' if len(errors) == 1 else 'extensions'}:\n"
+                + "\n".join(f"  - {e}" for e in errors)
+            )
+    else:
+        for index, i in enumerate(i for group in build_groups.values() for i in group):
+            _logger.info(f"Building {i.path} ({index + 1}/{len(to_build)})…")
             i.build(release=release)
-        else:
-            not_built.append(i)
 
     if not_built:
         _logger.info(f"Skipped building {len(not_built)} {'extension' if len(not_built) == 1 else 'extensions'} due"
@@ -208,6 +301,43 @@ def build_all(root_directory, opt_in: bool = True, force_rebuild: bool = setting
     return [i for i in importables if i not in not_built], not_built
 
 
+_default_ignored_dirs = frozenset({'.git', '.hg', '.tox', '.venv', 'venv', 'node_modules', 'target', '__pycache__'})
+"""Directory names `build_all` never descends into; they cannot contain eligible sources."""
+
+
+def _load_rustimportignore(root_directory):
+    """
+    Read ignore patterns for `build_all` from a ".rustimportignore" file in the given
+    root directory, if present. Patterns follow `fnmatch` syntax and are matched against
+    paths relative to the root directory; empty lines and "#"-comments are skipped.
+    """
+    import os
+
+    try:
+        with open(os.path.join(root_directory, '.rustimportignore')) as f:
+            return [
+                line.strip().rstrip('/')
+                for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _is_ignored(path, root_directory, ignore_patterns) -> bool:
+    if not ignore_patterns:
+        return False
+
+    import fnmatch
+    import os
+
+    relpath = os.path.relpath(path, root_directory)
+    return any(
+        fnmatch.fnmatch(relpath, pattern) or fnmatch.fnmatch(os.path.basename(relpath), pattern)
+        for pattern in ignore_patterns
+    )
+
+
 def load_ipython_extension(ipython):
     """IPython magic entry point."""
     rustc_is_installed = which("rustc") is not None
@@ -2,19 +2,20 @@ import argparse
 import logging
 import os
 import re
+import string
 import sys
 from typing import List
 
 from rustimport import build_all, build_filepath, settings
 from rustimport.pre_processing import PyO3Template
 
-rust_lib_template = """// rustimport:pyo3
+rust_lib_template = string.Template("""// rustimport:pyo3
 
 use pyo3::prelude::*;
 
 #[pyfunction]
 fn say_hello() {
-    println!("Hello from {{EXTENSION_NAME}}, implemented in Rust!")
+    println!("Hello from ${EXTENSION_NAME}, implemented in Rust!")
 }
 
 // Uncomment the below to implement custom pyo3 binding code. Otherwise, 
@@ -22,14 +23,14 @@ fn say_hello() {
 // #[pyfunction] and all structs annotated with #[pyclass].
 //
 //#[pymodule]
-//fn {{EXTENSION_NAME}}(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
+//fn ${EXTENSION_NAME}(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 //    m.add_function(wrap_pyfunction!(say_hello, m)?)?;
 //    Ok(())
 //}
-"""
+""")
 
-cargo_toml_template = """[package]
-name = "{{EXTENSION_NAME}}"
+cargo_toml_template = string.Template("""[package]
+name = "${EXTENSION_NAME}"
 version = "0.1.0"
 edition = "2021"
 
@@ -45,22 +46,25 @@ edition = "2021"
 # default configuration.
 [lib]
 # The name of the native library. This is the name which will be used in Python to import the
-# library (i.e. `import {{EXTENSION_NAME}}`).
-name = "{{EXTENSION_NAME}}"
+# library (i.e. `import ${EXTENSION_NAME}`).
+name = "${EXTENSION_NAME}"
 #
 # "cdylib" is necessary to produce a shared library for Python to import from.
 # Downstream Rust code (including code in `bin/`, `examples/`, and `examples/`) will not be able
-# to `use {{EXTENSION_NAME}};` unless the "rlib" or "lib" crate type is also included, e.g.:
+# to `use ${EXTENSION_NAME};` unless the "rlib" or "lib" crate type is also included, e.g.:
 # crate-type = ["cdylib", "rlib"]
 crate-type = ["cdylib"]
 
 [dependencies]
-pyo3 = { version = "{{PYO3_VERSION}}", features = ["extension-module"] }
-"""
+pyo3 = { version = "${PYO3_VERSION}", features = ["extension-module"] }
+""")
 
 
-def create_extension(name: str, cwd: str = '.'):
-    if not re.match(r'^[a-zA-Z]\w*(\.rs)?$', name):
+_extension_name_re = re.compile(r'^[a-zA-Z]\w*(\.rs)?$')
+
+
+def create_extension(name: str, cwd: str = '.') -> str:
+    if not _extension_name_re.match(os.path.basename(name)):
         raise ValueError(f"Invalid extension name: {name}. The name may only contain letters (preferably lowercase), "
                          f"numbers and underscores and should start with a letter.")
 
@@ -68,20 +72,24 @@ def create_extension(name: str, cwd: str = '.'):
     name = os.path.splitext(os.path.basename(name))[0]
 
     if path.endswith(".rs"):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, 'w+') as f:
-            f.write(rust_lib_template.replace('{{EXTENSION_NAME}}', name))
+            f.write(rust_lib_template.substitute(EXTENSION_NAME=name))
     else:
         src_dir = os.path.join(path, 'src')
         os.makedirs(src_dir)
         with open(os.path.join(src_dir, 'lib.rs'), 'w+') as f:
-            f.write(rust_lib_template.replace('{{EXTENSION_NAME}}', name))
+            f.write(rust_lib_template.substitute(EXTENSION_NAME=name))
         with open(os.path.join(path, 'Cargo.toml'), 'w+') as f:
-            f.write(cargo_toml_template
-                    .replace('{{EXTENSION_NAME}}', name)
-                    .replace('{{PYO3_VERSION}}', PyO3Template.PYO3_VERSION))
+            f.write(cargo_toml_template.substitute(
+                EXTENSION_NAME=name,
+                PYO3_VERSION=PyO3Template.PYO3_VERSION,
+            ))
         with open(os.path.join(path, '.rustimport'), 'w+') as f:
             f.write("This is a marker-file to make this crate importable by rustimport.")
 
+    return path
+
 
 def _run_from_commandline(raw_args: List[str]):
     parser = argparse.ArgumentParser("rustimport")
@@ -112,13 +120,21 @@ def _run_from_commandline(raw_args: List[str]):
     build_parser.add_argument(
         "--release", "-r", action="store_true", help="Build release-optimized binaries (toggle's cargo's --release flag)."
     )
+    build_parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Number of extensions to build in parallel when building a directory.",
+    )
 
     new_parser = subparsers.add_parser(
         "new",
-        help="Create a new crate or single-file extension ready to be imported with rustimport. If the specified "
-             "name ends with \".rs\", a single-file extension is created, otherwise, a crate will be set up.",
+        help="Create one or more new crates or single-file extensions ready to be imported with rustimport. If a "
+             "specified name ends with \".rs\", a single-file extension is created, otherwise, a crate will be set up.",
+    )
+    new_parser.add_argument("path", nargs="+")
+    new_parser.add_argument(
+        "--then-build", "-b", action="store_true",
+        help="Build the newly created extension(s) right away, in the same process.",
     )
-    new_parser.add_argument("path")
 
     args = parser.parse_args(raw_args[1:])
 
@@ -141,11 +157,15 @@ def _run_from_commandline(raw_args: List[str]):
             if os.path.isfile(path):
                 build_filepath(path, release=release, force_rebuild=force)
             elif os.path.isdir(path):
-                build_all(path, release=release, force_rebuild=force)
+                build_all(path, release=release, force_rebuild=force, workers=args.jobs)
             else:
                 raise FileNotFoundError(f'The given root path "{path}" could not be found.')
     elif args.action == "new":
-        create_extension(args.path)
+        created = [create_extension(path) for path in args.path]
+        if args.then_build:
+            for path in created:
+                build_filepath(path, release=settings.compile_release_binaries,
+                               force_rebuild=settings.force_rebuild)
     else:
         parser.print_usage()
 
@@ -170,13 +190,19 @@ class CLILoggingFormatter(logging.Formatter):
     }
     COLORLESS_FORMAT = format_tag + format_message
 
-    def format(self, record):
+    def __init__(self):
+        super().__init__()
+        # Build the per-level formatters once — creating a new Formatter for every
+        # record would re-parse the format string each time. Whether the terminal
+        # supports color doesn't change over the process lifetime either.
+        self._colorless_formatter = logging.Formatter(self.COLORLESS_FORMAT)
         if self.supports_color():
-            log_fmt = self.FORMATS.get(record.levelno)
+            self._formatters = {level: logging.Formatter(fmt) for level, fmt in self.FORMATS.items()}
         else:
-            log_fmt = self.COLORLESS_FORMAT
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+            self._formatters = {}
+
+    def format(self, record):
+        return self._formatters.get(record.levelno, self._colorless_formatter).format(record)
 
     @staticmethod
     def supports_color():
@@ -1,8 +1,12 @@
 import glob
+import json
 import logging
+import mmap
 import os
 import struct
-from typing import List, Tuple, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Optional
 
 from rustimport import settings
 
@@ -11,6 +15,168 @@ _FMT = struct.Struct("q" + str(len(_TAG)) + "s")
 
 logger = logging.getLogger(__name__)
 
+_stat_cache: Optional[Dict[str, os.stat_result]] = None
+_expansion_cache: Optional[Dict[Tuple[str, ...], List[str]]] = None
+
+
+@contextmanager
+def cached_stats():
+    """
+    Within this context, `os.stat` results and file-pattern expansions for
+    checksummed files are memoized.
+
+    Importables often share dependency files (e.g. a workspace's Cargo.toml or
+    lockfile), so bulk operations like `build_all` can use this to stat each
+    unique path only once instead of once per importable. Since checking never
+    modifies the source files, the cached results stay valid for the duration
+    of the pass.
+    """
+    global _stat_cache, _expansion_cache
+    if _stat_cache is not None:  # already active in an outer scope
+        yield
+        return
+
+    _stat_cache = {}
+    _expansion_cache = {}
+    try:
+        yield
+    finally:
+        _stat_cache = None
+        _expansion_cache = None
+
+
+def _walk_files(root: str):
+    """
+    Yield all file paths below `root`, recursively. Cheaper than a recursive glob,
+    which re-stats every entry and yields directories as well.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry.path
+
+
+def _hash_file(filepath: str, hasher) -> str:
+    """
+    Hash a file's contents in bounded chunks, keeping the working set small even
+    for large vendored or generated sources.
+    """
+    h = hasher()
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size > (64 << 10):
+            # For larger files, hash the memory-mapped contents: the pages are
+            # faulted in once without a Python-side copy and stay hot in the page
+            # cache for the build that typically follows.
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    h.update(m)
+                return h.hexdigest()
+            except (ValueError, OSError):
+                pass  # e.g. the file changed size; fall back to plain reads
+
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _max_mtime(paths: List[str]) -> int:
+    """
+    Return the largest `st_mtime_ns` among the given paths (0 if empty).
+
+    For larger file sets, the stat syscalls are issued from a thread pool — the
+    interpreter releases the GIL around `stat()`, so the syscalls overlap instead
+    of being serialized.
+    """
+    if len(paths) > 16:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return max(executor.map(lambda p: _stat(p).st_mtime_ns, paths), default=0)
+    return max((_stat(p).st_mtime_ns for p in paths), default=0)
+
+
+def _stat(path: str) -> os.stat_result:
+    if _stat_cache is None:
+        return os.stat(path)
+    if (res := _stat_cache.get(path)) is None:
+        res = _stat_cache[path] = os.stat(path)
+    return res
+
+
+class _FileChecksumCache:
+    """
+    A persistent cache mapping file paths to their last known checksum, keyed by
+    the file's `(mtime_ns, size)` fingerprint. This allows skipping re-hashing of
+    files that haven't changed since a previous rustimport invocation.
+
+    The cache is stored as a single json file in `settings.cache_dir` and loaded
+    lazily on first use.
+    """
+
+    def __init__(self):
+        self.__entries = None
+        self.__dirty = False
+        self.__save_lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(settings.cache_dir, 'checksums.json')
+
+    def get(self, filepath: str, hasher) -> bytes:
+        """
+        Return the checksum for `filepath`, either from the cache (if the file's
+        fingerprint is unchanged) or by hashing the file's contents.
+        """
+        if self.__entries is None:
+            self.__load()
+
+        stat = _stat(filepath)
+        fingerprint = [stat.st_mtime_ns, stat.st_size, hasher().name]
+
+        if (entry := self.__entries.get(filepath)) is not None and entry[:3] == fingerprint:
+            return entry[3].encode()
+
+        checksum = _hash_file(filepath, hasher)
+
+        self.__entries[filepath] = [*fingerprint, checksum]
+        self.__dirty = True
+        return checksum.encode()
+
+    def save(self):
+        """Write the cache back to disk, if it has been modified."""
+        # `save()` may run concurrently on build_all's worker threads and in
+        # parallel rustimport processes sharing one cache dir; the lock keeps
+        # this process' writers from interleaving and the pid/thread-unique
+        # temp name keeps other processes out of our half-written file, so
+        # `os.replace` always publishes a complete snapshot.
+        with self.__save_lock:
+            if not self.__dirty:
+                return
+
+            os.makedirs(settings.cache_dir, exist_ok=True)
+            tmp_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.__entries, f)
+            os.replace(tmp_path, self.path)
+            self.__dirty = False
+
+    def __load(self):
+        try:
+            with open(self.path) as f:
+                self.__entries = json.load(f)
+        except (OSError, ValueError):
+            self.__entries = {}
+
+
+_checksum_cache = _FileChecksumCache()
+
 
 def is_checksum_valid(extension_path: str, file_patterns: List[str], release: bool = False) -> bool:
     """
@@ -21,7 +187,16 @@ def is_checksum_valid(extension_path: str, file_patterns: List[str], release: bo
     if old_checksum is None:
         return False  # Already logged error in load_checksum_trailer.
     try:
-        return old_checksum == _calc_cur_checksum(file_patterns, release=release)
+        files = _expand_file_patterns(file_patterns)
+
+        # Fast path: if the stored checksum was built with the same release flag and
+        # no source file has been modified since the extension was built, the sources
+        # can't have changed and re-hashing them is unnecessary:
+        if old_checksum.startswith(_release_marker(release)):
+            if _max_mtime(files) <= os.stat(extension_path).st_mtime_ns:
+                return True
+
+        return old_checksum == _calc_cur_checksum(files, release=release)
     except OSError as e:
         logger.info(
             "Checksummed file not found while checking rustimport checksum "
@@ -35,22 +210,48 @@ def save_checksum(extension_path: str, file_patterns: List[str], release: bool =
     Calculate the module checksum and then write it to the end of the shared
     object.
     """
-    _save_checksum_trailer(extension_path, _calc_cur_checksum(file_patterns, release=release))
+    _save_checksum_trailer(extension_path, _calc_cur_checksum(_expand_file_patterns(file_patterns), release=release))
+
+
+_trailer_cache: Dict[str, Tuple[int, int, Optional[bytes]]] = {}
 
 
 def _load_checksum_trailer(extension_path: str) -> Optional[bytes]:
     try:
+        # Memoize the trailer per extension fingerprint, so repeated checks in the
+        # same process don't re-open the shared object. Appending a new trailer
+        # changes mtime and size and thus invalidates the entry naturally.
+        stat = os.stat(extension_path)
+        if (cached := _trailer_cache.get(extension_path)) is not None \
+                and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        # A single tail read covers both the fixed-size trailer and the checksum in
+        # front of it in all realistic cases, instead of two positioned reads:
+        tail_size = min(stat.st_size, 4096)
         with open(extension_path, "rb") as f:
-            f.seek(-_FMT.size, 2)
-            length, tag = _FMT.unpack(f.read(_FMT.size))
+            f.seek(-tail_size, 2)
+            tail = f.read(tail_size)
+
+        checksum = None
+        if tail_size < _FMT.size:
+            logger.info("The extension is too small to contain a checksum trailer; rebuilding.")
+        else:
+            length, tag = _FMT.unpack(tail[-_FMT.size:])
             if tag != _TAG:
                 logger.info(
                     "The extension is missing the trailer tag and thus is missing"
                     " its checksum; rebuilding."
                 )
-                return None
-            f.seek(-(_FMT.size + length), 2)
-            return f.read(length)
+            elif length <= tail_size - _FMT.size:
+                checksum = tail[-(_FMT.size + length):-_FMT.size]
+            else:  # an unusually long checksum; needs its own read
+                with open(extension_path, "rb") as f:
+                    f.seek(-(_FMT.size + length), 2)
+                    checksum = f.read(length)
+
+        _trailer_cache[extension_path] = (stat.st_mtime_ns, stat.st_size, checksum)
+        return checksum
     except FileNotFoundError:
         logger.info("Failed to find compiled extension; rebuilding.")
         return None
@@ -63,14 +264,25 @@ def _save_checksum_trailer(extension_path: str, cur_checksum: bytes):
         file.write(cur_checksum + _FMT.pack(len(cur_checksum), _TAG))
 
 
-def _calc_cur_checksum(file_patterns: List[str], hasher=settings.checksum_hasher, release: bool = False) -> bytes:
+def _release_marker(release: bool) -> bytes:
+    # The marker is stored in plain text in front of the hash, so that validity checks
+    # can tell whether an extension was built with "--release" without re-hashing all
+    # of its sources:
+    return b"r:" if release else b"d:"
+
+
+def _expand_file_patterns(file_patterns: List[str]) -> List[str]:
     """
-    Calculate the checksum for the given list of file patterns.
+    Resolve a list of file paths, directories and glob patterns into a sorted,
+    duplicate-free list of concrete file paths.
 
-    By default, sha1 is used as it has the [best performance](https://github.com/SharkyRawr/python-hashlib-benchmark)
-    and is [reasonably collision-proof](https://crypto.stackexchange.com/a/2584).
+    Within a `cached_stats` context, expansions are memoized per pattern tuple, so
+    the check and save phases of a build don't both re-walk the same directories.
+    The memo is deliberately bound to the context — an unbounded cache could miss
+    files created after the first expansion.
     """
-    checksums: List[Tuple[str, str]] = []
+    if _expansion_cache is not None and (files := _expansion_cache.get(tuple(file_patterns))) is not None:
+        return files
 
     all_files: List[str] = []
 
@@ -79,21 +291,39 @@ def _calc_cur_checksum(file_patterns: List[str], hasher=settings.checksum_hasher
             for file in glob.iglob(entity, recursive=True):
                 all_files.append(file)
         elif os.path.isdir(entity):
-            for file in glob.iglob(os.path.join(entity, '**'), recursive=True):
-                all_files.append(file)
+            all_files.extend(_walk_files(entity))
         else:
             all_files.append(entity)
 
-    for filepath in sorted(all_files):
-        with open(filepath, "rb") as f:
-            if not any(c[0] == filepath for c in checksums):
-                checksums.append((filepath, hasher(f.read()).hexdigest()))
+    files = list(dict.fromkeys(sorted(all_files)))
+    if _expansion_cache is not None:
+        _expansion_cache[tuple(file_patterns)] = files
+    return files
+
+
+def _calc_cur_checksum(unique_files: List[str], hasher=settings.checksum_hasher, release: bool = False) -> bytes:
+    """
+    Calculate the checksum for the given list of files (as produced by
+    `_expand_file_patterns`).
+    """
+    if len(unique_files) > 8:
+        # Hashing releases the GIL (as do the file reads feeding it), so checksumming
+        # many files in a thread pool overlaps I/O and compute across cores:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+            digests = list(executor.map(lambda p: _checksum_cache.get(p, hasher), unique_files))
+    else:
+        digests = [_checksum_cache.get(p, hasher) for p in unique_files]
 
-    payload = '\n'.join(
-        f'{p}:{c}' for p, c in checksums
-    ).encode()
+    checksums: List[Tuple[str, str]] = [(p, d.decode()) for p, d in zip(unique_files, digests)]
+    _checksum_cache.save()
 
-    if release:
-        payload = b"r\n" + payload
+    # Feed the hasher incrementally instead of materializing the whole joined
+    # payload in memory first (it grows with the number of dependency files):
+    h = hasher()
+    for index, (p, c) in enumerate(checksums):
+        if index:
+            h.update(b'\n')
+        h.update(f'{p}:{c}'.encode())
 
-    return hasher(payload).hexdigest().encode()
+    return _release_marker(release) + h.hexdigest().encode()
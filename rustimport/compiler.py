@@ -1,5 +1,13 @@
 import json
 import logging
+
+try:
+    # orjson is an optional dependency; its C implementation parses cargo's
+    # message stream several times faster than the stdlib json module:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+import functools
 import os
 import shutil
 import subprocess
@@ -53,22 +61,36 @@ class Cargo:
         if additional_args:
             cmd.extend(additional_args)
 
-        _logger.debug(f'Building {crate_path}: {" ".join(cmd)}')
+        _logger.debug('Building %s: %s', crate_path, ' '.join(cmd))
 
         proc = subprocess.Popen(
             cmd,
             cwd=crate_path,
+            env=self.__build_env(),
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE if suppress_output else None,
         )
 
         with proc:
+            stderr_thread = None
+            stderr_buf = bytearray()
+            if suppress_output:
+                # Drain stderr concurrently with the stdout loop; otherwise cargo
+                # blocks as soon as it fills the stderr pipe (e.g. on long error
+                # cascades) while we in turn block waiting for stdout — a deadlock.
+                import threading
+                stderr_thread = threading.Thread(target=lambda: stderr_buf.extend(proc.stderr.read()))
+                stderr_thread.start()
+
             result = self.__handle_build_process(crate_path, proc)
 
+            if stderr_thread is not None:
+                stderr_thread.join()
+
         if not result.success and suppress_output:
             _logger.error(f"Compilation failed. Cargo build output:\n\n"
                           + '\n'.join(result.error_output) +
-                          f"{proc.stderr.read().decode()}")
+                          f"{stderr_buf.decode()}")
 
         _logger.info(f'Cargo exited with code {result.exit_code}.')
 
@@ -78,6 +100,51 @@ class Cargo:
 
         return result
 
+    @staticmethod
+    def __build_env() -> Optional[Dict[str, str]]:
+        """
+        Assemble the environment for the cargo process, or return `None` to inherit
+        the current one unchanged.
+        """
+        if settings.incremental is None:
+            # In CI environments, incremental artifacts are pure overhead for
+            # throwaway target directories, so we disable them by default there:
+            incremental = None if not os.environ.get('CI') else False
+        else:
+            incremental = settings.incremental
+
+        if settings.pgo is None and incremental is None and not settings.sccache:
+            return None
+
+        env = os.environ.copy()
+
+        if incremental is not None:
+            env['CARGO_INCREMENTAL'] = '1' if incremental else '0'
+
+        if settings.sccache:
+            if (sccache_path := shutil.which('sccache')) is None:
+                raise FileNotFoundError(
+                    'settings.sccache is enabled, but the sccache binary was not found on the PATH. '
+                    'See https://github.com/mozilla/sccache for installation instructions.'
+                )
+            env['RUSTC_WRAPPER'] = sccache_path
+            env.setdefault('SCCACHE_DIR', os.path.join(settings.cache_dir, 'sccache'))
+
+        if settings.pgo is not None:
+            profile_dir = os.path.join(settings.cache_dir, 'pgo')
+            rustflags = env.get('RUSTFLAGS', '')
+
+            if settings.pgo == 'generate':
+                os.makedirs(profile_dir, exist_ok=True)
+                env['RUSTFLAGS'] = f'{rustflags} -Cprofile-generate={profile_dir}'.strip()
+            elif settings.pgo == 'use':
+                env['RUSTFLAGS'] = f'{rustflags} -Cprofile-use={_merge_pgo_profiles(profile_dir)}'.strip()
+            else:
+                raise ValueError(f'Invalid value for settings.pgo: {settings.pgo!r} '
+                                 f'(expected None, "generate" or "use").')
+
+        return env
+
     @classmethod
     def __handle_build_process(cls, crate_path: str, proc: subprocess.Popen) -> BuildResult:
         """
@@ -95,11 +162,22 @@ class Cargo:
         messages = []
         error_output = []
 
-        while (exit_code := proc.poll()) is None:
-            line = proc.stdout.readline()
-
-            if line.strip():
-                messages.append(message := json.loads(line))
+        # Read cargo's output in large chunks instead of line by line — one read()
+        # syscall then covers many messages — and carry partial lines over between
+        # chunks. The blocking reads also replace the previous `proc.poll()`
+        # busy-check; the stream simply ends when cargo exits.
+        buffer = b''
+        for chunk in iter(lambda: proc.stdout.read1(65536), b''):
+            buffer += chunk
+            *lines, buffer = buffer.split(b'\n')  # the remainder is an incomplete last line or empty
+
+            for line in lines:
+                # Only "compiler-artifact" and "compiler-message" records are ever
+                # consulted, so cheaply pre-filter on the raw bytes before paying
+                # for JSON parsing — large builds emit thousands of other records:
+                if b'"compiler-artifact"' not in line and b'"compiler-message"' not in line:
+                    continue
+                messages.append(message := _json_loads(line))
 
                 if message.get('reason') == 'compiler-artifact':
                     manifest_path = os.path.realpath(message.get('manifest_path'))
@@ -111,6 +189,8 @@ class Cargo:
                     else:
                         error_output.append(message['message']['rendered'])
 
+        exit_code = proc.wait()
+
         return cls.BuildResult(
             success=exit_code == 0,
             exit_code=exit_code,
@@ -120,7 +200,34 @@ class Cargo:
         )
 
 
+def _merge_pgo_profiles(profile_dir: str) -> str:
+    """
+    Merge the raw profiles collected by a `settings.pgo = "generate"` build into a
+    single profdata file usable with `-Cprofile-use` and return its path.
+    """
+    import glob
+
+    merged_path = os.path.join(profile_dir, 'merged.profdata')
+    raw_profiles = glob.glob(os.path.join(profile_dir, '*.profraw'))
+
+    if raw_profiles:
+        llvm_profdata = shutil.which('llvm-profdata') or require('llvm-profdata')
+        _logger.info(f'Merging {len(raw_profiles)} pgo profiles into {merged_path}…')
+        subprocess.run([llvm_profdata, 'merge', '-o', merged_path, *raw_profiles], check=True)
+    elif not os.path.isfile(merged_path):
+        raise FileNotFoundError(
+            f'No pgo profiling data found in {profile_dir}. Build and exercise the extension '
+            f'with settings.pgo = "generate" first.'
+        )
+
+    return merged_path
+
+
+@functools.lru_cache(maxsize=None)
 def require(executable_name: str):
+    # Memoized: `shutil.which` walks the whole PATH, and e.g. every `Cargo()`
+    # instantiation resolves the cargo executable again. Lookup failures raise
+    # and are thus not cached.
     path = shutil.which(executable_name)
 
     if path:
@@ -1,11 +1,21 @@
 import os
 import sys
+from typing import Dict, FrozenSet, Tuple
 
 from rustimport.error_handling import get_potential_failure_reasons
 from rustimport.importable import all_importables, Importable
 
+_lookup_cache: Dict[Tuple[str, bool], Importable] = {}
+
 
 def find_module_importable(modulename: str, opt_in: bool = False) -> Importable:
+    # Memoize successful lookups — repeated imports of the same module would otherwise
+    # re-walk all of sys.path. Negative results are deliberately not cached, so sources
+    # created after a failed lookup are still found. Staleness of the returned
+    # importable's sources is handled by `should_rebuild` on every use.
+    if (importable := _lookup_cache.get((modulename, opt_in))) is not None:
+        return importable
+
     importable = _find_importable(modulename, opt_in)
     if importable is None:
         reasons_list = "\n".join([
@@ -16,14 +26,72 @@ def find_module_importable(modulename: str, opt_in: bool = False) -> Importable:
             f"Couldn't find a valid import target matching the module name: {modulename} (opt_in: {opt_in})." +
             (f" This could be potential reasons: \n{reasons_list}" if reasons_list else "")
         )
+
+    _lookup_cache[(modulename, opt_in)] = importable
     return importable
 
 
+def clear_lookup_cache():
+    """Forget all memoized module lookups, e.g. after source files have been moved or deleted."""
+    _lookup_cache.clear()
+    _dir_cache.clear()
+
+
+_dir_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+
+def _dir_entries(path: str) -> FrozenSet[str]:
+    """
+    The entry names of the given directory (empty if it cannot be listed).
+
+    Listings are cached per directory and validated against the directory's mtime,
+    which changes whenever entries are added, removed or renamed — so the common
+    case costs one stat syscall while new source files are still picked up.
+    """
+    try:
+        mtime = os.stat(path or '.').st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    if (cached := _dir_cache.get(path)) is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        entries = frozenset(os.listdir(path or '.'))
+    except OSError:
+        entries = frozenset()
+    _dir_cache[path] = (mtime, entries)
+    return entries
+
+
+def module_candidate_exists(modulename: str) -> bool:
+    """
+    Cheaply check whether any sys.path entry contains a file or directory that could
+    provide the given module, without probing the candidates themselves.
+    """
+    top_level = modulename.split(".")[0]
+    rs_name = f'{top_level}.rs'
+    return any(
+        top_level in (entries := _dir_entries(pth)) or rs_name in entries
+        for pth in sys.path
+    )
+
+
 def _find_importable(modulename, opt_in=False):
     modulepath = modulename.replace(".", os.sep)
+    top_level = modulename.split(".")[0]
 
+    # Probing every sys.path entry with every importable class costs several stat
+    # syscalls per entry — for every lookup. Instead, list each sys.path directory
+    # once (cached, see `_dir_entries`) and only probe entries that actually contain
+    # a matching top-level file or directory.
     for pth in sys.path:
+        entries = _dir_entries(pth)
+        if top_level not in entries and f'{top_level}.rs' not in entries:
+            continue
+
+        candidate = os.path.join(pth, modulepath)  # shared by all importable types
         for importable in all_importables:
-            if i := importable.try_create(os.path.join(pth, modulepath), fullname=modulename, opt_in=opt_in):
+            if i := importable.try_create(candidate, fullname=modulename, opt_in=opt_in):
                 return i
 
@@ -3,11 +3,12 @@ import logging
 import sys
 import types
 from importlib.machinery import ModuleSpec
-from typing import Sequence, Optional
+from typing import TYPE_CHECKING, Sequence, Optional
 
 from rustimport import settings
-from rustimport.find import find_module_importable
-from rustimport.importable import Importable, should_rebuild
+
+if TYPE_CHECKING:
+    from rustimport.importable import Importable
 
 _logger = logging.getLogger(__name__)
 
@@ -26,6 +27,15 @@ class Finder(importlib.abc.MetaPathFinder):
         try:
             self.__running = True
 
+            # Imported lazily to keep the build machinery out of release-mode processes:
+            from rustimport.find import find_module_importable, module_candidate_exists
+
+            # This finder runs for every import in the process, almost all of which
+            # have nothing to do with rust. Bail out via the cheap existence check
+            # before engaging the full lookup (and its ImportError machinery):
+            if not module_candidate_exists(fullname):
+                return None
+
             importable = find_module_importable(fullname, opt_in=True)
 
             if importable is not None:
@@ -41,23 +51,44 @@ class Finder(importlib.abc.MetaPathFinder):
             self.__running = False
 
 
+# The extension mtimes seen at the last successful load, per extension path. Once a
+# binary has been loaded into this process, re-running the rebuild check for it is
+# pointless as long as the binary on disk is unchanged — dlopen would keep handing
+# out the already-loaded library anyway:
+_last_loaded: dict = {}
+
+
 class Loader(importlib.abc.Loader):
-    def __init__(self, importable: Importable):
+    def __init__(self, importable: 'Importable'):
         self.__importable = importable
 
+    def __build_and_load(self) -> types.ModuleType:
+        import os
+        from rustimport.importable import should_rebuild
+
+        try:
+            mtime = os.stat(self.__importable.extension_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if mtime is None or _last_loaded.get(self.__importable.extension_path) != mtime:
+            if should_rebuild(self.__importable):
+                self.__importable.build(release=settings.compile_release_binaries)
+                mtime = os.stat(self.__importable.extension_path).st_mtime_ns
+
+        module = self.__importable.load()
+        _last_loaded[self.__importable.extension_path] = mtime
+        return module
+
     def create_module(self, spec: ModuleSpec) -> Optional[types.ModuleType]:
-        if should_rebuild(self.__importable):
-            self.__importable.build(release=settings.compile_release_binaries)
-        return self.__importable.load()
+        return self.__build_and_load()
 
     def exec_module(self, module: types.ModuleType) -> None:
         pass
 
     # Deprecated; provided for older python versions:
     def load_module(self, fullname: str) -> types.ModuleType:
-        if should_rebuild(self.__importable):
-            self.__importable.build(release=settings.compile_release_binaries)
-        return self.__importable.load()
+        return self.__build_and_load()
 
 
 if settings.rtld_flags or not settings.release_mode:
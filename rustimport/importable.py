@@ -1,11 +1,8 @@
 import abc
-import hashlib
 import logging
 import os.path
-import shutil
-import sysconfig
 import types
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Optional, List, Type, Set
 
 from rustimport import load, BuildError, settings
@@ -21,18 +18,33 @@ class Importable(abc.ABC):
     """Abstract interface for importable rust entities"""
 
     def __init__(self, path: str, fullname: Optional[str] = None):
-        self.path = os.path.realpath(path)
+        self.__raw_path = path
         self.fullname = fullname or os.path.splitext(os.path.basename(path))[0]
 
-    @property
+    @cached_property
+    def path(self) -> str:
+        # Resolved lazily: realpath lstats every path component, which is wasted
+        # work for importables that are only constructed and never used further.
+        return os.path.realpath(self.__raw_path)
+
+    @cached_property
     def extension_path(self) -> str:
+        # Immutable after construction (as are `path` and `name`), so it is computed
+        # only once per instance instead of on every rebuild check, build and load:
         return os.path.join(os.path.dirname(self.path), self.name) + get_extension_suffix()
 
-    @property
+    @cached_property
     def build_tempdir(self) -> str:
-        return os.path.join(settings.cache_dir, f'{self.fullname}-{hashlib.md5(self.path.encode()).hexdigest()}')
+        import hashlib
 
-    @property
+        # blake2b is only used to derive a collision-safe directory name from the
+        # path; 8 bytes keep the name short and it beats md5 on short inputs.
+        return os.path.join(
+            settings.cache_dir,
+            f'{self.fullname}-{hashlib.blake2b(self.path.encode(), digest_size=8).hexdigest()}',
+        )
+
+    @cached_property
     def name(self) -> str:
         return self.fullname.split('.')[-1]
 
@@ -77,16 +89,16 @@ class Importable(abc.ABC):
 class SingleFileImportable(Importable):
     """Importable for single-file rust libraries (a single .rs file)"""
 
-    @property
+    @cached_property
     def dependencies(self):
         directory = os.path.dirname(self.path)
-        p = Preprocessor(self.path, lib_name=self.name).process()
+        p = _preprocess(self.path, lib_name=self.name)
         return [
             self.path,
             *[os.path.join(directory, d) for d in p.dependency_file_patterns]
         ]
 
-    @property
+    @cached_property
     def __crate_name(self):
         return os.path.splitext(os.path.basename(self.path))[0]
 
@@ -95,39 +107,52 @@ class SingleFileImportable(Importable):
         if not path.endswith('.rs'):
             path += '.rs'
 
-        if os.path.isfile(path):
-            if opt_in and not _check_first_line_contains_rustimport(path):
-                if fullname:
-                    notify_potential_failure_reason(
-                        f"An importable candidate for the module `{fullname}` was found at {path}, but does "
-                        f"not contain the rustimport opt-in comment. If this is the intended importable, "
-                        f"either add \"// rustimport\" to it's first line or use "
-                        f"`{fullname.split('.')[-1]} = rustimport.imp(\"{fullname}\")` to import the module."
-                    )
-                return None
-
-            _logger.debug(f"[try_import]: Successfully created SingleFileImportable to import from {path}.")
-            return SingleFileImportable(path, fullname=fullname)
-        _logger.debug(f"[try_import]: Failed to create a SingleFileImportable to import from {path}.")
+        try:
+            # With opt-in, the first-line check doubles as the existence check (it
+            # opens the file anyway), saving the separate stat syscall per candidate:
+            if opt_in:
+                if not _check_first_line_contains_rustimport(path):
+                    if fullname:
+                        notify_potential_failure_reason(
+                            f"An importable candidate for the module `{fullname}` was found at {path}, but does "
+                            f"not contain the rustimport opt-in comment. If this is the intended importable, "
+                            f"either add \"// rustimport\" to it's first line or use "
+                            f"`{fullname.split('.')[-1]} = rustimport.imp(\"{fullname}\")` to import the module."
+                        )
+                    return None
+            elif not os.path.isfile(path):
+                raise FileNotFoundError(path)
+        except OSError:
+            _logger.debug("[try_import]: Failed to create a SingleFileImportable to import from %s.", path)
+            return None
+
+        _logger.debug("[try_import]: Successfully created SingleFileImportable to import from %s.", path)
+        return SingleFileImportable(path, fullname=fullname)
 
     def build(self, release: bool = False):
         path = os.path.join(self.build_tempdir, self.__crate_name)
 
-        _logger.debug(f"Building in temporary directory {path}")
+        _logger.debug("Building in temporary directory %s", path)
         src_path = os.path.join(path, 'src')
 
         os.makedirs(src_path, exist_ok=True)
 
-        preprocessed = Preprocessor(self.path, lib_name=self.name).process()
+        preprocessed = _preprocess(self.path, lib_name=self.name)
 
         if preprocessed.updated_source is not None:
-            with open(os.path.join(src_path, 'lib.rs'), 'wb+') as f:
-                f.write(preprocessed.updated_source)
+            _write_if_changed(os.path.join(src_path, 'lib.rs'), preprocessed.updated_source)
         else:
-            shutil.copy2(self.path, os.path.join(src_path, 'lib.rs'))
-
-        with open(os.path.join(path, 'Cargo.toml'), 'wb+') as f:
-            f.write(preprocessed.cargo_manifest)
+            lib_path = os.path.join(src_path, 'lib.rs')
+            src_stat = os.stat(self.path)
+            try:
+                dst_stat = os.stat(lib_path)
+                unchanged = (src_stat.st_mtime_ns, src_stat.st_size) == (dst_stat.st_mtime_ns, dst_stat.st_size)
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                _copy_with_mtime(self.path, lib_path, src_stat)
+
+        _write_if_changed(os.path.join(path, 'Cargo.toml'), preprocessed.cargo_manifest)
 
         build_result = Cargo().build(
             path,
@@ -150,28 +175,20 @@ class CrateImportable(Importable):
     workspace – i.e. it handles the according dependencies.
     """
 
-    @property
+    @cached_property
     def __crate_path(self) -> str:
         return os.path.dirname(self.__manifest_path)
 
-    @property
+    @cached_property
     def __manifest_path(self) -> str:
         return self.path if self.path.lower().endswith("/cargo.toml") else os.path.join(self.path, 'Cargo.toml')
 
     @cached_property
     def __workspace_path(self) -> Optional[str]:
         """Returns the path of the cargo workspace this crate belongs to, if there is any."""
-        root_dir = os.path.realpath(".").split(os.path.sep)[0] + os.path.sep
-        p = self.__crate_path
-        while os.path.dirname(p) != root_dir:  # loop through all parent directories...
-            p = os.path.dirname(p)
-
-            if os.path.isfile(os.path.join(p, "Cargo.toml")):  # ... and check for a "Cargo.toml" file in each of them.
-                return p
+        return _find_workspace_path(self.__crate_path)
 
-        return None
-
-    @property
+    @cached_property
     def build_tempdir(self) -> str:
         # We overwrite this property in order to return a temporary directory that
         # is specific to the workspace (if any), not to the crate being built. This
@@ -181,11 +198,13 @@ class CrateImportable(Importable):
         if not self.__workspace_path:
             return super().build_tempdir
 
+        import hashlib
+
         return os.path.join(
             settings.cache_dir,
             '{name}-{hash}'.format(
                 name=os.path.basename(self.__workspace_path),
-                hash=hashlib.md5(self.__workspace_path.encode()).hexdigest(),
+                hash=hashlib.blake2b(self.__workspace_path.encode(), digest_size=8).hexdigest(),
             )
         )
 
@@ -194,11 +213,10 @@ class CrateImportable(Importable):
         root_path = self.__workspace_path or self.__crate_path
         src_path = os.path.join(self.__crate_path, 'src')
 
-        p = Preprocessor(os.path.join(src_path, 'lib.rs'), lib_name=self.name).process()
+        p = _preprocess(os.path.join(src_path, 'lib.rs'), lib_name=self.name)
 
         return [
-            os.path.join(root_path, '**/*.rs'),
-            os.path.join(root_path, '**/Cargo.*'),
+            *_crate_source_files(root_path),
             *[os.path.join(src_path, d) for d in p.dependency_file_patterns],
         ]
 
@@ -207,23 +225,28 @@ class CrateImportable(Importable):
         manifest_path = path if path.lower().endswith("/cargo.toml") else os.path.join(path, 'Cargo.toml')
         directory = os.path.dirname(manifest_path)
 
-        if os.path.isfile(manifest_path):
-            if opt_in \
-                    and not os.path.isfile(os.path.join(directory, '.rustimport')) \
-                    and not _check_first_line_contains_rustimport(manifest_path):
-                if fullname:
-                    notify_potential_failure_reason(
-                        f"A crate importable candidate for the module `{fullname}` was found at {path}, but "
-                        f"it does not contain the rustimport opt-in marker. If this is the intended importable, "
-                        f"either add a \".rustimport\" file in the crate's root directory or use "
-                        f"`{fullname.split('.')[-1]} = rustimport.imp(\"{fullname}\")` to import it."
-                    )
+        try:
+            if opt_in and not os.path.isfile(os.path.join(directory, '.rustimport')):
+                # The first-line check doubles as the manifest existence check (it
+                # opens the manifest anyway), saving one stat syscall per candidate:
+                if not _check_first_line_contains_rustimport(manifest_path):
+                    if fullname:
+                        notify_potential_failure_reason(
+                            f"A crate importable candidate for the module `{fullname}` was found at {path}, but "
+                            f"it does not contain the rustimport opt-in marker. If this is the intended importable, "
+                            f"either add a \".rustimport\" file in the crate's root directory or use "
+                            f"`{fullname.split('.')[-1]} = rustimport.imp(\"{fullname}\")` to import it."
+                        )
+                    return None
+            elif not os.path.isfile(manifest_path):
                 return None
             return CrateImportable(path=directory, fullname=fullname)
+        except OSError:
+            return None
 
     def build(self, release: bool = False):
         if self.__workspace_path is not None:
-            _logger.debug(f"The crate belongs to workspace {self.__workspace_path}")
+            _logger.debug("The crate belongs to workspace %s", self.__workspace_path)
 
         root_output_path = self._copy_source_to_build_dir()
 
@@ -233,7 +256,7 @@ class CrateImportable(Importable):
             os.path.relpath(self.__crate_path, self.__workspace_path or self.__crate_path)
         ))
 
-        _logger.debug(f"Building in temporary directory {crate_output_subdirectory}")
+        _logger.debug("Building in temporary directory %s", crate_output_subdirectory)
 
         preprocessor_result = self._preprocess(crate_output_subdirectory)
 
@@ -265,28 +288,85 @@ class CrateImportable(Importable):
             os.path.basename(self.__workspace_path or self.__crate_path)
         )
 
-        os.makedirs(output_path, exist_ok=True)
-
         def ignore(directory: str, names: List[str]) -> Set[str]:
             # Do not copy the root "target" folder as it may be huge and slow:
             return {'target'} if directory in (src_path, output_path) else set()
 
-        # Track the copied files, so we can delete files that are no longer in the source directory:
-        copied_files = set()
-
-        def copy_function(src, dst):
-            shutil.copy2(src, dst)
-            copied_files.add(dst)
-
-        shutil.copytree(src_path, output_path, ignore=ignore, copy_function=copy_function, dirs_exist_ok=True)
+        # Walk the source tree once, collecting the directory structure and the
+        # (source, destination) file pairs:
+        directories = []
+        file_pairs = []
+        stack = [(src_path, output_path)]
+        while stack:
+            source_dir, dest_dir = stack.pop()
+            directories.append(dest_dir)
+            with os.scandir(source_dir) as it:
+                for entry in it:
+                    if entry.name in ignore(source_dir, []):
+                        continue
+                    if entry.is_dir():
+                        stack.append((entry.path, os.path.join(dest_dir, entry.name)))
+                    else:
+                        file_pairs.append((entry.path, os.path.join(dest_dir, entry.name)))
+
+        # Also enumerate what is already in the destination, so that files whose
+        # source has vanished can be removed with a set difference afterwards
+        # instead of re-walking the (then larger) destination tree:
+        existing_files = set()
+        dest_stack = [output_path]
+        while dest_stack:
+            current = dest_stack.pop()
+            try:
+                it = os.scandir(current)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignore(current, []):
+                            dest_stack.append(entry.path)
+                    else:
+                        existing_files.add(entry.path)
+
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+
+        def sync_file(src: str, dst: str):
+            src_stat = os.stat(src)
+            try:
+                dst_stat = os.stat(dst)
+                if (src_stat.st_mtime_ns, src_stat.st_size) == (dst_stat.st_mtime_ns, dst_stat.st_size):
+                    # Unchanged since the last build; leaving the destination untouched
+                    # also preserves cargo's fingerprint cache for this file.
+                    return
+                os.remove(dst)  # never write through a potentially hardlinked destination
+            except OSError:
+                pass
+
+            if os.path.basename(dst) in ('Cargo.toml', 'lib.rs'):
+                # These may be rewritten with preprocessor output in the build directory,
+                # which must never leak back into the original sources — copy them:
+                _copy_with_mtime(src, dst, src_stat)
+            else:
+                try:
+                    os.link(src, dst)  # metadata-only, no file contents are moved
+                except OSError:  # e.g. cross-device links or an unsupporting file system
+                    _copy_with_mtime(src, dst, src_stat)
+
+        if len(file_pairs) > 16:
+            # The sync is bound by syscall latency, not bandwidth, and the involved
+            # syscalls release the GIL — so a thread pool overlaps them nicely:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                for _ in executor.map(lambda pair: sync_file(*pair), file_pairs):
+                    pass
+        else:
+            for src, dst in file_pairs:
+                sync_file(src, dst)
 
         # Delete files that are no longer in the source directory:
-        for root, dirs, files in os.walk(output_path, topdown=True):
-            dirs[:] = set(dirs) - ignore(root, dirs)  # remove ignored directories from the walk
-
-            for file in files:
-                if (abs_path := os.path.join(root, file)) not in copied_files:
-                    os.remove(abs_path)
+        for stale in existing_files.difference(dst for _, dst in file_pairs):
+            os.remove(stale)
 
         return output_path
 
@@ -295,18 +375,16 @@ class CrateImportable(Importable):
         Calls [Preprocessor.process()] on the crate, updates the source files
         with the result and returns the result for further usage.
         """
-        preprocessed = Preprocessor(
+        preprocessed = _preprocess(
             os.path.join(self.__crate_path, 'src/lib.rs'),
             lib_name=self.name,
             cargo_manifest_path=os.path.join(self.__crate_path, 'Cargo.toml'),
-        ).process()
+        )
 
         if preprocessed.updated_source is not None:
-            with open(os.path.join(crate_output_subdirectory, 'src/lib.rs'), 'wb') as f:
-                f.write(preprocessed.updated_source)
+            _write_if_changed(os.path.join(crate_output_subdirectory, 'src/lib.rs'), preprocessed.updated_source)
 
-        with open(os.path.join(crate_output_subdirectory, 'Cargo.toml'), 'wb') as f:
-            f.write(preprocessed.cargo_manifest)
+        _write_if_changed(os.path.join(crate_output_subdirectory, 'Cargo.toml'), preprocessed.cargo_manifest)
 
         return preprocessed
 
@@ -317,18 +395,167 @@ all_importables: List[Type[Importable]] = [
 ]
 
 
-def _check_first_line_contains_rustimport(filepath: str) -> bool:
-    with open(filepath, "r") as f:
-        while not (line := f.readline().strip()):  # skip empty lines
+def importable_for_path(path: str, fullname: Optional[str] = None, opt_in: bool = True) -> Optional[Importable]:
+    """
+    Create the appropriate `Importable` for the given file system path, or return
+    `None` if the path does not point to an importable rust source.
+
+    The path's type is determined directly (crate directory vs. single file) instead
+    of probing every entry in `all_importables`, so only one `try_create` runs.
+    """
+    if os.path.isdir(path) or path.lower().endswith('/cargo.toml'):
+        return CrateImportable.try_create(path, fullname=fullname, opt_in=opt_in)
+    return SingleFileImportable.try_create(path, fullname=fullname, opt_in=opt_in)
+
+
+_workspace_cache: dict = {}
+"""Maps a directory to the closest directory at or above it containing a "Cargo.toml" (or `None`)."""
+
+
+def _find_workspace_path(crate_path: str) -> Optional[str]:
+    """
+    Find the root of the cargo workspace containing `crate_path`, if any, by walking
+    up its parent directories and checking each for a "Cargo.toml" file.
+
+    Ancestor directories are cached process-wide: all crates below the same workspace
+    share their ancestor chain, so only the first one pays for the walk.
+    """
+    root_dir = os.path.realpath(".").split(os.path.sep)[0] + os.path.sep
+    unresolved = []
+    result = None
+
+    p = crate_path
+    while os.path.dirname(p) != root_dir:  # loop through all parent directories...
+        p = os.path.dirname(p)
+
+        try:
+            result = _workspace_cache[p]
+            break
+        except KeyError:
             pass
-        return "rustimport" in line
+
+        if os.path.isfile(os.path.join(p, "Cargo.toml")):  # ... and check for a "Cargo.toml" file in each of them.
+            result = _workspace_cache[p] = p
+            break
+
+        unresolved.append(p)
+
+    for directory in unresolved:
+        _workspace_cache[directory] = result
+    return result
+
+
+def _preprocess(path: str, lib_name: str, cargo_manifest_path: Optional[str] = None) -> Preprocessor.PreprocessorResult:
+    """
+    Run the `Preprocessor` for the given source file, memoizing results per input
+    mtimes. One import cycle parses the same sources several times otherwise —
+    through `dependencies` in the rebuild check, again in `build` and once more
+    when saving the checksum.
+    """
+    mtime_key = os.stat(path).st_mtime_ns
+    if cargo_manifest_path is not None:
+        mtime_key = (mtime_key, os.stat(cargo_manifest_path).st_mtime_ns)
+    return _preprocess_cached(path, lib_name, cargo_manifest_path, mtime_key)
+
+
+@lru_cache(maxsize=128)
+def _preprocess_cached(path, lib_name, cargo_manifest_path, _mtime_key) -> Preprocessor.PreprocessorResult:
+    return Preprocessor(path, lib_name=lib_name, cargo_manifest_path=cargo_manifest_path).process()
+
+
+def _crate_source_files(root_path: str) -> List[str]:
+    """
+    Collect all `*.rs` and `Cargo.*` files below `root_path` with a scandir walk.
+
+    This replaces the recursive `**`-glob patterns previously used for crate
+    dependencies: it avoids glob's per-entry fnmatch overhead and prunes `target`
+    directories, whose (potentially huge) build artifacts are not source files and
+    only slowed the checksum down.
+    """
+    files = []
+    stack = [root_path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != 'target':
+                        stack.append(entry.path)
+                elif entry.name.endswith('.rs') or entry.name.startswith('Cargo.'):
+                    files.append(entry.path)
+    return files
+
+
+def _copy_with_mtime(src: str, dst: str, src_stat: Optional[os.stat_result] = None):
+    """
+    Copy a file into the build directory, carrying over the source's mtime (which
+    the sync's skip check and cargo's fingerprinting rely on) — but unlike
+    `shutil.copy2` without replicating permissions and xattrs, which cost extra
+    syscalls per file and don't matter for throwaway build inputs.
+    """
+    import shutil
+
+    shutil.copyfile(src, dst)
+    st = src_stat or os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _write_if_changed(filepath: str, content: bytes):
+    """
+    Write `content` to `filepath` unless the file already has exactly that content.
+
+    Rewriting identical build inputs (e.g. the generated Cargo.toml) would bump
+    their mtime and needlessly invalidate cargo's fingerprint cache.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+
+def _check_first_line_contains_rustimport(filepath: str) -> bool:
+    # Memoized per (path, mtime): the same candidate may be probed repeatedly during
+    # module resolution, and a cache hit costs one stat instead of an open and read.
+    # The stat also preserves the raising-OSError-if-missing contract the callers
+    # rely on as their existence check.
+    return _check_first_line_cached(filepath, os.stat(filepath).st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _check_first_line_cached(filepath: str, _mtime_ns: int) -> bool:
+    # A single bounded binary read — this check runs for every sys.path candidate
+    # during module resolution, and decoding (or reading) more than the head that
+    # can contain the first meaningful line would be wasted work:
+    with open(filepath, "rb") as f:
+        head = f.read(4096)
+
+    for line in head.splitlines():
+        if line := line.strip():  # skip empty lines
+            return b"rustimport" in line
+    return False  # the file is empty (or blank)
 
 
+@lru_cache(maxsize=None)
 def get_extension_suffix():
+    import sysconfig
+
+    # The suffix is a fixed property of the interpreter, so the sysconfig lookups
+    # only ever need to run once per process:
     sysvar = sysconfig.get_config_var  # just an abbreviation for below
     return sysvar("EXT_SUFFIX") or sysvar("SO") or '.so'
 
 
+_rebuild_check_cache: dict = {}
+
+
 def should_rebuild(imp: Importable, force_rebuild: bool = False, force_release: bool = False):
     """
     Utility to check whether the given `Importable` should be re-built, based on the given
@@ -339,4 +566,28 @@ def should_rebuild(imp: Importable, force_rebuild: bool = False, force_release:
         return False
     if settings.force_rebuild or force_rebuild:
         return True
-    return imp.needs_rebuild(release=settings.compile_release_binaries or force_release)
+
+    release = settings.compile_release_binaries or force_release
+
+    # Memoize "up to date" verdicts for single-file importables so that repeated imp()
+    # calls in the same process (e.g. in notebooks) become a stat + dict lookup. Crate
+    # importables are excluded since their directory mtime doesn't reflect edits to
+    # nested sources, and a rebuild-needed verdict is never cached as building changes
+    # the very state it was derived from.
+    mtime = None
+    if os.path.isfile(imp.path):
+        mtime = os.stat(imp.path).st_mtime_ns
+        if (cached := _rebuild_check_cache.get((imp.path, release))) is not None and cached[0] == mtime:
+            return cached[1]
+
+    result = imp.needs_rebuild(release=release)
+
+    if mtime is not None and not result:
+        _rebuild_check_cache[(imp.path, release)] = (mtime, result)
+
+    return result
+
+
+def clear_rebuild_cache():
+    """Forget all memoized `should_rebuild` verdicts."""
+    _rebuild_check_cache.clear()
@@ -3,6 +3,7 @@ import importlib.util
 import sys
 import subprocess
 import time
+from functools import cached_property
 from importlib.machinery import ExtensionFileLoader
 from pathlib import Path
 from shutil import which
@@ -23,21 +24,22 @@ class RustImportIPython(Magics):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._loaded_module = set()
+
+    @cached_property
+    def _env_fingerprint(self) -> tuple:
+        # The toolchain fingerprint that keys compiled cells. Computed lazily on the
+        # first %%rustimport cell: spawning rustc takes ~100ms, which registering the
+        # magic alone shouldn't pay for.
         rustc = which("rustc")
-        self._rust_version = subprocess.check_output([rustc, "--version"]).decode(
-            "utf8"
-        )
-        self._python_version = sys.version_info
-        self._rustimport_version = version("rustimport")
+        rust_version = subprocess.check_output([rustc, "--version"]).decode("utf8")
+        return rust_version, sys.version_info, version("rustimport")
 
     def _find_compiled_file(self, module_name, lib_path):
-        # Find compiled file
-        module_path = None
-        for path in lib_path.iterdir():
-            if path.name.startswith(module_name) and path.suffix != ".rs":
-                module_path = path
-                break
-        return module_path
+        # The compiled file's location is fully determined by the module name, so
+        # there is no need to scan the (ever-growing) magic cache directory for it:
+        from rustimport.importable import get_extension_suffix
+
+        return lib_path / f"{module_name}{get_extension_suffix()}"
 
     @cell_magic
     @magic_arguments.magic_arguments()
@@ -73,9 +75,7 @@ class RustImportIPython(Magics):
             sys.executable,
             args.release,
             args.module_path_variable,
-            self._rust_version,
-            self._python_version,
-            self._rustimport_version,
+            *self._env_fingerprint,
         ]
         if args.force:
             # Add time to key to force the rebuild
@@ -97,7 +97,16 @@ class RustImportIPython(Magics):
         module_file = lib_path / f"{module_name}.rs"
 
         cell = f"""// rustimport:pyo3\n{cell}"""
-        module_file.write_text(cell)
+        # After a kernel restart the same cell hashes to the same module name, so the
+        # source file usually already holds exactly this content. Don't rewrite it in
+        # that case: an unchanged mtime lets the subsequent build_filepath call verify
+        # freshness with a couple of stat calls instead of re-hashing (or rebuilding):
+        try:
+            unchanged = module_file.read_text() == cell
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            module_file.write_text(cell)
 
         # Lazy load here because of circular imports
         from rustimport import build_filepath
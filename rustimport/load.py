@@ -1,6 +1,5 @@
 import logging
 import sys
-from contextlib import contextmanager
 
 from rustimport import settings
 
@@ -18,22 +17,33 @@ def _actually_load_module(extension_path: str, fullname: str):
 
 
 def load_module(extension_path: str, fullname: str):
+    # If this exact extension is already imported, hand it back instead of paying
+    # the dlopen + module-init roundtrip again (which, for an unchanged binary,
+    # would yield the very same library handle anyway):
+    existing = sys.modules.get(fullname)
+    if existing is not None and getattr(existing, "__file__", None) == extension_path:
+        return existing
+
     with dlopen_flags():
         return _actually_load_module(extension_path, fullname)
 
 
-@contextmanager
-def dlopen_flags():
-    # See `rustimport.settings.rtld_flags` for an explanation
+class dlopen_flags:
+    # See `rustimport.settings.rtld_flags` for an explanation.
+    #
+    # A plain context-manager class rather than a @contextmanager generator: this
+    # runs on every module load, and the generator variant allocates and drives a
+    # generator frame per use.
+
+    __slots__ = ("_old_flags",)
 
-    if hasattr(sys, "getdlopenflags"):
-        old_flags = sys.getdlopenflags()
-        new_flags = old_flags | settings.rtld_flags
+    def __enter__(self):
+        if hasattr(sys, "getdlopenflags"):
+            self._old_flags = sys.getdlopenflags()
+            sys.setdlopenflags(self._old_flags | settings.rtld_flags)
+        else:
+            self._old_flags = None
 
-        try:
-            sys.setdlopenflags(new_flags)
-            yield
-        finally:
-            sys.setdlopenflags(old_flags)
-    else:
-        yield
+    def __exit__(self, *exc_info):
+        if self._old_flags is not None:
+            sys.setdlopenflags(self._old_flags)
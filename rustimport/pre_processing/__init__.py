@@ -1,10 +1,51 @@
+import hashlib
+import importlib.metadata
+import os
+import pickle
 import re
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict, Type
 
-from rustimport.pre_processing.base import merge_cargo_manifests, Template
+from rustimport import settings
+from rustimport.pre_processing.base import load_cargo_manifest, merge_cargo_manifests, Template
 from rustimport.pre_processing.pyo3_template import PyO3Template
 
+# Compiled once at import time — `__parse_header` runs for every imported module,
+# and re.match with a literal pattern re-consults re's pattern cache on each call.
+_HEADER_RE = re.compile(rb'//\s*rustimport(?:\s*:\s*([\w-]+))?$')
+
+# Part of the on-disk cache key: cached results bake in rustimport's own
+# templating output (e.g. the pinned pyo3 version), so entries must not outlive
+# the rustimport version that produced them. The pyo3 pin is included separately
+# so uninstalled dev checkouts at least invalidate on a pyo3 bump.
+try:
+    _dist_version = importlib.metadata.version('rustimport')
+except importlib.metadata.PackageNotFoundError:
+    _dist_version = ''
+_CACHE_TAG = f'{_dist_version}:{PyO3Template.PYO3_VERSION}'
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file through a raw fd, sized from fstat.
+
+    Skips the BufferedReader layer that `open(path, 'rb').read()` sets up and reads
+    the exact file size in (normally) one syscall instead of 8 KiB chunks.
+    """
+    # O_BINARY keeps Windows' CRT from translating CRLF and truncating at 0x1A;
+    # it doesn't exist (and isn't needed) elsewhere:
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        contents = os.read(fd, size)
+        while len(contents) < size:  # regular files rarely short-read, but be safe
+            chunk = os.read(fd, size - len(contents))
+            if not chunk:
+                break
+            contents += chunk
+        return contents
+    finally:
+        os.close(fd)
+
 
 class Preprocessor:
     @dataclass
@@ -20,20 +61,59 @@ class Preprocessor:
         self.cargo_manifest_path = cargo_manifest_path
 
     def process(self) -> PreprocessorResult:
-        with open(self.path, 'rb') as f:
-            contents = f.read()
+        # The whole pipeline is deterministic in the source file and the cargo
+        # manifest, so results are persisted under `settings.cache_dir` keyed by
+        # both files' mtimes — a fresh interpreter (the common dev-loop case)
+        # can then skip reading, parsing and templating entirely:
+        cache_path = self.__cache_path()
+        if cache_path is not None:
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if isinstance(cached, self.PreprocessorResult):
+                    return cached
+            except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+                pass  # treat any unreadable/outdated cache entry as a miss
+
+        result = self.__process_uncached()
+
+        if cache_path is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)  # atomic w.r.t. concurrent readers
+            except OSError:
+                pass
+        return result
+
+    def __cache_path(self) -> Optional[str]:
+        """The on-disk cache location for this preprocessing input, or None if it cannot be determined."""
+        try:
+            key = f'{_CACHE_TAG}|{self.path}|{os.stat(self.path).st_mtime_ns}|{self.lib_name}'
+            if self.cargo_manifest_path is not None:
+                key += f'|{self.cargo_manifest_path}|{os.stat(self.cargo_manifest_path).st_mtime_ns}'
+        except OSError:
+            return None
+        return os.path.join(settings.cache_dir, 'preprocessed', hashlib.sha1(key.encode()).hexdigest() + '.pkl')
+
+    def __process_uncached(self) -> PreprocessorResult:
+        contents = _read_file(self.path)
 
         manifest, template_name, deps = self.__parse_header(contents)
 
         if self.cargo_manifest_path is not None:
-            with open(self.cargo_manifest_path, 'rb') as f:
-                if manifest.strip():
-                    manifest = merge_cargo_manifests(f.read(), manifest)
-                else:
-                    manifest = f.read()
+            if manifest.strip():
+                # The parsed manifest comes from a process-wide cache (see
+                # `load_cargo_manifest`) — in a crate with many source files the
+                # same Cargo.toml would otherwise be re-parsed for each of them:
+                manifest = merge_cargo_manifests(load_cargo_manifest(self.cargo_manifest_path), manifest)
+            else:
+                manifest = _read_file(self.cargo_manifest_path)
 
         if template_name:
-            template = all_templates[template_name.lower()](self.path, self.lib_name, contents, manifest)
+            template = all_templates[template_name](self.path, self.lib_name, contents, manifest)
             templating_result = template.process()
         else:
             templating_result = None
@@ -47,22 +127,40 @@ class Preprocessor:
 
     @staticmethod
     def __parse_header(contents: bytes) -> Tuple[bytes, Optional[str], List[str]]:
-        manifest = b''
         template_name = None
-        dependency_file_patterns = []
+        manifest_lines: List[bytes] = []
+        dependency_file_patterns: List[str] = []
 
-        if m := re.match(rb'//\s*rustimport(?:\s*:\s*([\w-]+))?$', contents.lstrip().split(b'\n', 1)[0].strip()):
-            template_name = m.group(1).decode() if m.group(1) else None
+        # Step through the file line by line via `find` rather than `splitlines()`:
+        # the header has to come before all code, so this stops after the first few
+        # lines and never materializes a line list proportional to the file size.
+        pos, size = 0, len(contents)
+        first_line = True
+        while pos < size:
+            eol = contents.find(b'\n', pos)
+            if eol == -1:
+                eol = size
+            line = contents[pos:eol].strip()
+            pos = eol + 1
 
-        for line in map(bytes.strip, contents.splitlines()):
+            if not line:
+                continue
+            if first_line:
+                first_line = False
+                if m := _HEADER_RE.match(line):
+                    # Normalized here once so downstream lookups into `all_templates`
+                    # (whose keys are lowercase) need no further processing:
+                    template_name = m.group(1).decode().lower() if m.group(1) else None
             # Break on first non-comment, non-empty line since the header must come before all code:
-            if line and not line.strip().startswith(b"//"):
+            if not line.startswith(b'//'):
                 break
             if line.startswith(b'//:'):
-                manifest += line[3:].lstrip() + b'\n'
+                manifest_lines.append(line[3:].lstrip())
             elif line.startswith(b'//d:'):
                 dependency_file_patterns.append(line[4:].lstrip().decode())
-        return manifest + b'\n', template_name, dependency_file_patterns
+
+        manifest = b''.join(line + b'\n' for line in manifest_lines) + b'\n'
+        return manifest, template_name, dependency_file_patterns
 
 
 all_templates: Dict[str, Type[Template]] = {
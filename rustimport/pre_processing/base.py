@@ -1,8 +1,16 @@
 import abc
+import functools
+import os
 import typing
 from dataclasses import dataclass
 
-import toml
+import tomli_w
+
+try:
+    import tomllib
+except ImportError:
+    # Python < 3.11
+    import tomli as tomllib
 
 
 class Template(abc.ABC):
@@ -27,18 +35,62 @@ class Template(abc.ABC):
 
 
 def merge_cargo_manifests(a: typing.Union[bytes, typing.Mapping], b: typing.Union[bytes, typing.Mapping]) -> bytes:
-    return toml.dumps(_recursive_setdefault(
-        toml.loads(b.decode()) if isinstance(b, bytes) else b,
-        toml.loads(a.decode()) if isinstance(a, bytes) else a,
+    return tomli_w.dumps(_recursive_setdefault(
+        tomllib.loads(b.decode()) if isinstance(b, bytes) else b,
+        tomllib.loads(a.decode()) if isinstance(a, bytes) else a,
     )).encode()
 
 
+def load_cargo_manifest(path: str) -> typing.MutableMapping:
+    """
+    The parsed contents of the `Cargo.toml` file at the given path.
+
+    Results are cached process-wide and keyed by the file's mtime and size, so a
+    workspace manifest shared by many crates is parsed only once instead of once per
+    preprocessed source file. Callers receive a clone of the cached mapping and may
+    mutate it freely.
+    """
+    stat = os.stat(path)
+    return _clone_toml(_load_cargo_manifest_cached(path, stat.st_mtime_ns, stat.st_size))
+
+
+def _clone_toml(x):
+    # Parsed TOML only ever contains dicts, lists and immutable scalars, so a
+    # two-branch recursive clone suffices — copy.deepcopy's generic dispatch and
+    # memoization would be an order of magnitude slower here.
+    t = type(x)
+    if t is dict:
+        return {k: _clone_toml(v) for k, v in x.items()}
+    if t is list:
+        return [_clone_toml(v) for v in x]
+    return x
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cargo_manifest_cached(path: str, mtime_ns: int, size: int) -> typing.Mapping:
+    with open(path, 'rb') as f:
+        return tomllib.loads(f.read().decode())
+
+
+_MISSING = object()
+
+
 def _recursive_setdefault(original: typing.MutableMapping, defaults: typing.MutableMapping):
-    for k, v in defaults.items():
-        if k in original and not isinstance(original[k], typing.MutableMapping):
-            continue
-        elif isinstance(v, typing.MutableMapping):
-            original[k] = _recursive_setdefault(original.get(k, {}), v)
-        else:
-            original[k] = v
+    # Implemented with an explicit stack instead of recursion — target-specific
+    # dependency tables nest several levels deep and per-call overhead adds up when
+    # merging manifests for every preprocessed file. The `_MISSING` sentinel gives
+    # one dict lookup per key instead of a `in` check plus a `get`.
+    stack = [(original, defaults)]
+    while stack:
+        mapping, defs = stack.pop()
+        for k, v in defs.items():
+            cur = mapping.get(k, _MISSING)
+            if cur is not _MISSING and not isinstance(cur, typing.MutableMapping):
+                continue  # an existing non-mapping value always wins over a default
+            if isinstance(v, typing.MutableMapping):
+                if cur is _MISSING:
+                    mapping[k] = cur = {}
+                stack.append((cur, v))
+            else:
+                mapping[k] = v
     return original
@@ -4,6 +4,19 @@ from typing import List
 
 from rustimport.pre_processing.base import Template
 
+# Compiled once at import time; these run against the full source of every
+# pyo3-templated module:
+_PYMODULE_RE = re.compile(rb'#\[pymodule]\s*(?:\w\s+)*?fn\s+([\w0-9]+)')
+# One alternation finding both `#[pyfunction]` functions and `#[pyclass]`
+# structs/enums, so the source is scanned once instead of twice. Neither branch
+# can span the other's attribute (the lazy gap groups cannot consume a `#`), so
+# the matches are the same as with two separate scans:
+_PYITEM_RE = re.compile(
+    rb'#\[pyfunction.*\s*(?:\w+\s+)*?(?:#\[pyo3.*)?\s*(?:\w+\s+)*?fn\s+(?P<function>[\w0-9]+)'
+    rb'|#\[pyclass]\s*(?:\w+\s+)*?(?:struct|enum)\s+(?P<cls>[\w0-9]+)',
+    re.MULTILINE,
+)
+
 
 class PyO3Template(Template):
     PYO3_VERSION = "0.21.2"
@@ -32,33 +45,40 @@ class PyO3Template(Template):
         })
 
     def __process_content(self) -> bytes:
-        if not re.search(rb'#\[pymodule]\s*(?:\w\s+)*?fn\s+([\w0-9]+)', self.contents):
+        # The cheap substring test short-circuits the regex for the common case of a
+        # file without a handwritten pymodule macro:
+        if b'#[pymodule]' not in self.contents or not _PYMODULE_RE.search(self.contents):
             # If the file doesn't contain the "pymodule" macro, we generate it automatically
             return self.contents + b"\n\n" + self.__generate_pymodule()
 
     def __generate_pymodule(self) -> bytes:
         # A rather rudimentary implementation of generating PyO3 the "pymodule" macro's contents
-        functions = re.finditer(
-            rb'#\[pyfunction.*\s*(?:\w+\s+)*?(?:#\[pyo3.*)?\s*(?:\w+\s+)*?fn\s+([\w0-9]+)', self.contents, re.MULTILINE
-        )
-        structs = re.finditer(rb'#\[pyclass]\s*(?:\w+\s+)*?(?:struct|enum)\s+([\w0-9]+)', self.contents, re.MULTILINE)
-
-        res = [
-            b'#[pymodule]',
-            b'fn ' + self.lib_name.encode() + b"(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {",
-            *[
-                b'  m.add_function(wrap_pyfunction!(' + func.group(1) + b', m)?)?;'
-                for func in functions
-            ],
-            *[
-                b'  m.add_class::<' + struct.group(1) + b'>()?;'
-                for struct in structs
-            ],
-            b'  Ok(())',
-            b'}'
-        ]
+        functions: List[bytes] = []
+        structs: List[bytes] = []
+        # Only pay for the regex scan if the relevant attribute macros occur at all
+        # (bytes.__contains__ is a fast C substring search):
+        if b'#[pyfunction' in self.contents or b'#[pyclass]' in self.contents:
+            for m in _PYITEM_RE.finditer(self.contents):
+                if (name := m.group('function')) is not None:
+                    functions.append(name)
+                else:
+                    structs.append(m.group('cls'))
 
-        return b'\n'.join(res)
+        # Assembled into one growing bytearray — building each line with `+`
+        # concatenation would allocate several transient bytes objects per entry:
+        buf = bytearray(b'#[pymodule]\nfn ')
+        buf += self.lib_name.encode()
+        buf += b"(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {\n"
+        for func in functions:
+            buf += b'  m.add_function(wrap_pyfunction!('
+            buf += func
+            buf += b', m)?)?;\n'
+        for struct in structs:
+            buf += b'  m.add_class::<'
+            buf += struct
+            buf += b'>()?;\n'
+        buf += b'  Ok(())\n}'
+        return bytes(buf)
 
     def __get_cargo_args(self) -> List[str]:
         args = []
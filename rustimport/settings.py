@@ -3,7 +3,14 @@ import os
 import tempfile
 from typing import Optional
 
-force_rebuild: bool = os.getenv("RUSTIMPORT_FORCE_REBUILD", "0").lower() in ("true", "yes", "1")
+_TRUTHY = frozenset(("true", "yes", "1", "on"))
+
+
+def _env_bool(name: str) -> bool:
+    return os.getenv(name, "0").lower() in _TRUTHY
+
+
+force_rebuild: bool = _env_bool("RUSTIMPORT_FORCE_REBUILD")
 """
 Whether to force rebuild on each import and build, even if the checksum matches, or not.
 
@@ -12,7 +19,7 @@ Whether to force rebuild on each import and build, even if the checksum matches,
 Env var: `RUSTIMPORT_FORCE_REBUILD=true`
 """
 
-release_mode: bool = os.getenv("RUSTIMPORT_RELEASE_MODE", "0").lower() in ("true", "yes", "1")
+release_mode: bool = _env_bool("RUSTIMPORT_RELEASE_MODE")
 """
 Set this to `True` in production environments to disable checksum-checks and file-existence checks.
 
@@ -22,7 +29,7 @@ import uncompiled extensions in release mode will cause `ImportError`s
 Env var: `RUSTIMPORT_RELEASE_MODE=true`
 """
 
-compile_release_binaries: bool = os.getenv("RUSTIMPORT_RELEASE_BINARIES", "0").lower() in ("true", "yes", "1")
+compile_release_binaries: bool = _env_bool("RUSTIMPORT_RELEASE_BINARIES")
 """
 Whether to compile optimized release binaries or not (toggles cargo's "--release" flag). This setting might
 be useful for debugging or benchmarking during development.
@@ -30,6 +37,50 @@ be useful for debugging or benchmarking during development.
 Env var: `RUSTIMPORT_RELEASE_BINARIES=true`
 """
 
+incremental: Optional[bool] = (
+    None if (_inc := os.getenv("RUSTIMPORT_INCREMENTAL")) is None
+    else _inc.lower() in _TRUTHY
+)
+"""
+Whether cargo should compile incrementally. The default (`None`) keeps cargo's own
+default, except in CI environments (detected via the `CI` env var), where incremental
+artifacts are pure overhead for throwaway target directories and are therefore disabled.
+Set to `True`/`False` to force either behaviour.
+
+Env var: `RUSTIMPORT_INCREMENTAL=false`
+"""
+
+pgo: Optional[str] = os.getenv("RUSTIMPORT_PGO") or None
+"""
+Profile-guided optimization mode; either `None` (off, the default), `"generate"` or `"use"`.
+
+With `"generate"`, binaries are instrumented to write profiling data to `<cache_dir>/pgo`
+while they run. After exercising the instrumented extension with a representative workload,
+rebuild with `"use"` (and `force_rebuild`) to compile a binary optimized for that profile.
+Merging the raw profiles requires `llvm-profdata` (e.g. via `rustup component add llvm-tools`).
+
+Env var: `RUSTIMPORT_PGO=generate` / `RUSTIMPORT_PGO=use`
+"""
+
+build_workers: int = int(os.getenv("RUSTIMPORT_BUILD_WORKERS", "1"))
+"""
+The default number of extensions `build_all` compiles in parallel. Crates within the same
+cargo workspace always build sequentially (they share one target directory); independent
+extensions scale up to the host's cpu count.
+
+Env var: `RUSTIMPORT_BUILD_WORKERS=<n>`
+"""
+
+sccache: bool = _env_bool("RUSTIMPORT_SCCACHE")
+"""
+Whether to compile through [sccache](https://github.com/mozilla/sccache), reusing compiled
+artifacts for identical inputs across projects and branches. Requires sccache to be
+installed and on the `PATH`. The cache is stored in `<cache_dir>/sccache` unless
+`SCCACHE_DIR` is already set in the environment.
+
+Env var: `RUSTIMPORT_SCCACHE=true`
+"""
+
 cargo_executable: Optional[str] = os.getenv("RUSTIMPORT_CARGO_EXECUTABLE")
 """
 The cargo executable path to use.
@@ -58,11 +109,30 @@ directory does not exist, it'll be created automatically.
 Env var: `RUSTIMPORT_CACHE_DIR=<directory path>`
 """
 
-checksum_hasher = hashlib.sha1
+try:
+    # xxhash is an optional dependency; since the checksums only detect changes and
+    # make no security claim, its non-cryptographic xxh3 is the fastest valid choice:
+    from xxhash import xxh3_128 as _default_hasher
+except ImportError:
+    try:
+        # blake3 is an optional dependency as well; its SIMD implementation still hashes
+        # several times faster than anything in hashlib:
+        from blake3 import blake3 as _default_hasher
+    except ImportError:
+        _default_hasher = hashlib.sha1
+
+checksum_hasher = _default_hasher
 """
 Specify the hash function to use for hashing. This function should be compatible with all the named
 constructors from `hashlib` (e.g. `hashlib.md5(...)`  or `hashlib.sha256(...)`).
 
-By default, sha1 is used as it has the [best performance](https://github.com/SharkyRawr/python-hashlib-benchmark)
-and is [reasonably collision-proof](https://crypto.stackexchange.com/a/2584).
+By default, [xxhash](https://pypi.org/project/xxhash/)'s xxh3_128 is used if it is installed, as it
+is by far the fastest option, followed by [blake3](https://pypi.org/project/blake3/) if available.
+Otherwise this falls back to sha1, which has the
+[best performance](https://github.com/SharkyRawr/python-hashlib-benchmark) among the `hashlib`
+algorithms and is [reasonably collision-proof](https://crypto.stackexchange.com/a/2584).
+On CPUs with SHA extensions, hardware-accelerated sha1/sha256 also outperform
+`hashlib.blake2b` by about 2x, so there is no faster stdlib-only choice.
+
+Collision resistance is not security-critical here — checksums only decide whether to rebuild.
 """
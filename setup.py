@@ -5,7 +5,7 @@ description = open("README.md").read()
 
 setup(
     packages=["rustimport", "rustimport.pre_processing"],
-    install_requires=["toml>=0.10.2"],
+    install_requires=["tomli>=1.1.0; python_version<'3.11'", "tomli-w>=1.0.0"],
     zip_safe=False,
     name="rustimport",
     version=version,
@@ -1,8 +1,79 @@
-import unittest  # noqa
+"""
+Run all test modules concurrently, one subprocess per module.
 
-from test_examples import *  # noqa
-from test_cli import *  # noqa
+The suite's wall time is dominated by cargo builds, which overlap well across idle
+cores; giving each test module its own interpreter lets those builds run in
+parallel while keeping per-process unittest state (e.g. `TestExamples`'
+setUpClass) intact. Use plain `python -m unittest` or pytest for sequential runs.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _warm_target_cache() -> None:
+    """Build one minimal extension before dispatching the test modules.
+
+    The test modules share a single cargo target directory, and cargo holds an
+    exclusive lock on it per build — on a cold cache the first build of each
+    module queues behind whichever one got there first, compiling the common
+    dependencies (pyo3 etc.) exactly once but blocking everything else until it
+    is done. Doing that single dependency build up front keeps the parallel
+    phase free of lock contention. Pointless on a warm cache, hence opt-in via
+    RUSTIMPORT_TEST_WARMUP=1.
+    """
+    with tempfile.TemporaryDirectory(suffix='-rustimport-test-warmup') as tmp:
+        shutil.copy(
+            os.path.join(os.path.dirname(TESTS_DIR), 'examples', 'minimal.rs'),
+            os.path.join(tmp, 'warmup.rs'),
+        )
+        env = os.environ.copy()
+        env['CARGO_TARGET_DIR'] = os.path.join(tempfile.gettempdir(), 'rustimport-test-target-cache')
+        subprocess.run(
+            [sys.executable, '-m', 'rustimport', 'build', 'warmup.rs'],
+            cwd=tmp,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def _run_module(module: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, '-m', 'unittest', '-v', f'tests.{module}'],
+        cwd=os.path.dirname(TESTS_DIR),
+        capture_output=True,
+        text=True,
+    )
+
+
+def main() -> int:
+    modules = sorted(
+        f[:-3] for f in os.listdir(TESTS_DIR)
+        if f.startswith('test_') and f.endswith('.py')
+    )
+
+    if os.environ.get('RUSTIMPORT_TEST_WARMUP', '0').lower() in ('true', 'yes', '1', 'on'):
+        _warm_target_cache()
+
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        results = executor.map(_run_module, modules)
+
+    exit_code = 0
+    for module, result in zip(modules, results):
+        print(f"===== tests.{module} =====")
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        if result.returncode != 0:
+            exit_code = 1
+    return exit_code
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(main())
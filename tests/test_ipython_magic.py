@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 from textwrap import dedent
@@ -8,21 +10,40 @@ from rustimport import load_ipython_extension
 
 
 class TestIPythonMagic(unittest.TestCase):
+    # Identical cells are already served from IPython's persistent cache dir via
+    # rustimport's checksums; what still rebuilds every run is the force-flag test,
+    # whose time-salted module name lands in a fresh build dir each time. Sharing
+    # one cargo target directory (as the other test modules do) limits that to
+    # recompiling the cell crate itself instead of all of its dependencies.
+    TARGET_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'rustimport-test-target-cache')
+
+    square_cell = dedent(
+        """use pyo3::prelude::*;
+
+        #[pyfunction]
+        fn square(x: i32) -> i32 {
+            x * x
+        }
+        """
+    )
+
     @classmethod
-    def setUp(cls) -> None:
-        if not hasattr(cls, "ip"):
-            cls.ip = get_ipython()
-            cls.ip.run_cell(r"%load_ext rustimport")
-
-        cls.square_cell = dedent(
-            """use pyo3::prelude::*;
-
-            #[pyfunction]
-            fn square(x: i32) -> i32 {
-                x * x
-            }
-            """
-        )
+    def setUpClass(cls) -> None:
+        # `get_ipython` returns a process-wide singleton, so the heavy IPython
+        # bootstrap runs once per process no matter how many classes use it;
+        # setUpClass (instead of the former per-test setUp with a hasattr guard)
+        # makes that explicit and loads the extension exactly once.
+        cls._old_cargo_target_dir = os.environ.get('CARGO_TARGET_DIR')
+        os.environ['CARGO_TARGET_DIR'] = cls.TARGET_CACHE_DIR
+        cls.ip = get_ipython()
+        cls.ip.run_cell(r"%load_ext rustimport")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        if cls._old_cargo_target_dir is None:
+            os.environ.pop('CARGO_TARGET_DIR', None)
+        else:
+            os.environ['CARGO_TARGET_DIR'] = cls._old_cargo_target_dir
 
     def test_helloworld_error(self):
         with self.assertRaises(BuildError):